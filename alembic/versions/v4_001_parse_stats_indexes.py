@@ -0,0 +1,30 @@
+"""add indexes backing parse_stats (transactions by wallet+status, wallets by entity)
+
+Revision ID: v4_001
+Revises: 9d62205851e4
+Create Date: 2026-10-16
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "v4_001"
+down_revision: Union[str, Sequence[str], None] = "9d62205851e4"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_tx_wallet_status", "transactions", ["wallet_id", "status"], postgresql_concurrently=True
+        )
+        op.create_index("ix_wallet_entity", "wallets", ["entity_id"], postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index("ix_wallet_entity", table_name="wallets", postgresql_concurrently=True)
+        op.drop_index("ix_tx_wallet_status", table_name="transactions", postgresql_concurrently=True)
@@ -0,0 +1,38 @@
+"""add indexes for realized-gains / open-lots listings
+
+Revision ID: v4_002
+Revises: v4_001
+Create Date: 2026-10-16
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "v4_002"
+down_revision: Union[str, Sequence[str], None] = "v4_001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_closed_lots_entity_sell",
+            "closed_lots",
+            ["entity_id", sa.text("sell_timestamp DESC"), "symbol"],
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "ix_open_lots_entity_buy",
+            "open_lots",
+            ["entity_id", "buy_timestamp", "symbol"],
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index("ix_open_lots_entity_buy", table_name="open_lots", postgresql_concurrently=True)
+        op.drop_index("ix_closed_lots_entity_sell", table_name="closed_lots", postgresql_concurrently=True)
@@ -0,0 +1,40 @@
+"""add partial indexes for gain-only / loss-only realized-gains queries
+
+Revision ID: v4_003
+Revises: v4_002
+Create Date: 2026-10-16
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "v4_003"
+down_revision: Union[str, Sequence[str], None] = "v4_002"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_closed_lots_gain_positive",
+            "closed_lots",
+            ["entity_id", "sell_timestamp"],
+            postgresql_where=sa.text("gain_usd > 0"),
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "ix_closed_lots_gain_negative",
+            "closed_lots",
+            ["entity_id", "sell_timestamp"],
+            postgresql_where=sa.text("gain_usd < 0"),
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index("ix_closed_lots_gain_negative", table_name="closed_lots", postgresql_concurrently=True)
+        op.drop_index("ix_closed_lots_gain_positive", table_name="closed_lots", postgresql_concurrently=True)
@@ -0,0 +1,30 @@
+"""add (wallet_id, subtype) index on accounts
+
+Revision ID: v4_004
+Revises: v4_003
+Create Date: 2026-10-16
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "v4_004"
+down_revision: Union[str, Sequence[str], None] = "v4_003"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_accounts_wallet_subtype",
+            "accounts",
+            ["wallet_id", "subtype"],
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index("ix_accounts_wallet_subtype", table_name="accounts", postgresql_concurrently=True)
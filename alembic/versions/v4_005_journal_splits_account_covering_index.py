@@ -0,0 +1,31 @@
+"""add covering account_id index on journal_splits for balance aggregation
+
+Revision ID: v4_005
+Revises: v4_004
+Create Date: 2026-10-16
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "v4_005"
+down_revision: Union[str, Sequence[str], None] = "v4_004"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_js_acct_covering",
+            "journal_splits",
+            ["account_id"],
+            postgresql_include=["quantity", "value_usd", "value_vnd"],
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index("ix_js_acct_covering", table_name="journal_splits", postgresql_concurrently=True)
@@ -0,0 +1,40 @@
+"""replace single-column taxable_transfers indexes with (entity_id, timestamp)
+
+Revision ID: v4_006
+Revises: v4_005
+Create Date: 2026-10-16
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "v4_006"
+down_revision: Union[str, Sequence[str], None] = "v4_005"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_OLD_INDEXES = {
+    "ix_taxable_transfers_entity_id": ["entity_id"],
+    "ix_taxable_transfers_timestamp": ["timestamp"],
+    "ix_taxable_transfers_symbol": ["symbol"],
+}
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_tt_entity_time",
+            "taxable_transfers",
+            ["entity_id", "timestamp"],
+            postgresql_concurrently=True,
+        )
+        for name in _OLD_INDEXES:
+            op.drop_index(name, table_name="taxable_transfers", postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, columns in _OLD_INDEXES.items():
+            op.create_index(name, "taxable_transfers", columns, postgresql_concurrently=True)
+        op.drop_index("ix_tt_entity_time", table_name="taxable_transfers", postgresql_concurrently=True)
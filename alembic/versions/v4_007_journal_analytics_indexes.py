@@ -0,0 +1,33 @@
+"""add entity/time covering index on journal_entries and journal_entry_id index on journal_splits
+
+Revision ID: v4_007
+Revises: v4_006
+Create Date: 2026-10-16
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "v4_007"
+down_revision: Union[str, Sequence[str], None] = "v4_006"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_je_entity_time",
+            "journal_entries",
+            ["entity_id", "timestamp"],
+            postgresql_include=["entry_type", "transaction_id"],
+            postgresql_concurrently=True,
+        )
+        op.create_index("ix_js_entry", "journal_splits", ["journal_entry_id"], postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index("ix_js_entry", table_name="journal_splits", postgresql_concurrently=True)
+        op.drop_index("ix_je_entity_time", table_name="journal_entries", postgresql_concurrently=True)
@@ -16,6 +16,7 @@ if TYPE_CHECKING:
 
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
 
 from cryptotax.db.models.journal import JournalEntry, JournalSplit
 from cryptotax.db.models.parse_error_record import ParseErrorRecord
@@ -128,7 +129,14 @@ class Bookkeeper:
                 self._session.add(split)
 
             await self._session.flush()
-            await self._session.refresh(entry, ["splits"])
+            # Reload splits eagerly so callers can iterate entry.splits without a lazy load
+            loaded = await self._session.execute(
+                select(JournalEntry)
+                .where(JournalEntry.id == entry.id)
+                .options(selectinload(JournalEntry.splits))
+                .execution_options(populate_existing=True)
+            )
+            entry = loaded.scalar_one()
 
             tx.status = TxStatus.PARSED.value
             tx.entry_type = result.entry_type
@@ -5,7 +5,7 @@ from collections import defaultdict
 from datetime import datetime
 from decimal import Decimal
 
-from sqlalchemy import delete, select
+from sqlalchemy import delete, insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
@@ -194,42 +194,55 @@ class TaxEngine:
             delete(TaxableTransferRecord).where(TaxableTransferRecord.entity_id == entity_id)
         )
 
-        for cl in closed_lots:
-            self._session.add(ClosedLotRecord(
-                entity_id=entity_id,
-                symbol=cl.symbol,
-                quantity=cl.quantity,
-                cost_basis_usd=cl.cost_basis_usd,
-                proceeds_usd=cl.proceeds_usd,
-                gain_usd=cl.gain_usd,
-                holding_days=cl.holding_days,
-                buy_entry_id=cl.buy_trade.journal_entry_id,
-                sell_entry_id=cl.sell_trade.journal_entry_id,
-                buy_timestamp=cl.buy_trade.timestamp,
-                sell_timestamp=cl.sell_trade.timestamp,
-            ))
-
-        for ol in open_lots:
-            self._session.add(OpenLotRecord(
-                entity_id=entity_id,
-                symbol=ol.symbol,
-                remaining_quantity=ol.remaining_quantity,
-                cost_basis_per_unit_usd=ol.cost_basis_per_unit_usd,
-                buy_entry_id=ol.buy_trade.journal_entry_id,
-                buy_timestamp=ol.buy_trade.timestamp,
-            ))
-
-        for tt in (taxable_transfers or []):
-            self._session.add(TaxableTransferRecord(
-                entity_id=entity_id,
-                journal_entry_id=tt.journal_entry_id,
-                symbol=tt.symbol,
-                quantity=tt.quantity,
-                value_usd=tt.value_usd,
-                value_vnd=tt.value_vnd,
-                tax_amount_vnd=tt.tax_amount_vnd,
-                exemption_reason=tt.exemption_reason.value if tt.exemption_reason else None,
-                timestamp=tt.timestamp,
-            ))
+        # One executemany per table instead of a unit-of-work INSERT per record
+        closed_rows = [
+            {
+                "entity_id": entity_id,
+                "symbol": cl.symbol,
+                "quantity": cl.quantity,
+                "cost_basis_usd": cl.cost_basis_usd,
+                "proceeds_usd": cl.proceeds_usd,
+                "gain_usd": cl.gain_usd,
+                "holding_days": cl.holding_days,
+                "buy_entry_id": cl.buy_trade.journal_entry_id,
+                "sell_entry_id": cl.sell_trade.journal_entry_id,
+                "buy_timestamp": cl.buy_trade.timestamp,
+                "sell_timestamp": cl.sell_trade.timestamp,
+            }
+            for cl in closed_lots
+        ]
+        open_rows = [
+            {
+                "entity_id": entity_id,
+                "symbol": ol.symbol,
+                "remaining_quantity": ol.remaining_quantity,
+                "cost_basis_per_unit_usd": ol.cost_basis_per_unit_usd,
+                "buy_entry_id": ol.buy_trade.journal_entry_id,
+                "buy_timestamp": ol.buy_trade.timestamp,
+            }
+            for ol in open_lots
+        ]
+        transfer_rows = [
+            {
+                "entity_id": entity_id,
+                "journal_entry_id": tt.journal_entry_id,
+                "symbol": tt.symbol,
+                "quantity": tt.quantity,
+                "value_usd": tt.value_usd,
+                "value_vnd": tt.value_vnd,
+                "tax_amount_vnd": tt.tax_amount_vnd,
+                "exemption_reason": tt.exemption_reason.value if tt.exemption_reason else None,
+                "timestamp": tt.timestamp,
+            }
+            for tt in (taxable_transfers or [])
+        ]
+
+        for model, rows in (
+            (ClosedLotRecord, closed_rows),
+            (OpenLotRecord, open_rows),
+            (TaxableTransferRecord, transfer_rows),
+        ):
+            if rows:
+                await self._session.execute(insert(model), rows)
 
         await self._session.flush()
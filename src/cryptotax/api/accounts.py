@@ -27,7 +27,9 @@ async def list_accounts(
     wallet_id: Optional[uuid.UUID] = Query(None),
 ) -> AccountList:
     account_repo = AccountRepo(db)
-    accounts = await account_repo.get_all_for_entity(
+    balances = await account_repo.get_balance_totals_for_entity(entity.id)
+    no_balance = (0, 0, 0)
+    accounts = account_repo.stream_all_for_entity(
         entity.id,
         account_type=account_type,
         subtype=subtype,
@@ -35,8 +37,6 @@ async def list_accounts(
         protocol=protocol,
         wallet_id=wallet_id,
     )
-    balances = await account_repo.get_balances_for_entity(entity.id)
-    balances_usd_vnd = await account_repo.get_balances_usd_vnd_for_entity(entity.id)
 
     return AccountList(
         accounts=[
@@ -49,11 +49,11 @@ async def list_accounts(
                 protocol=a.protocol,
                 balance_type=a.balance_type,
                 label=a.label,
-                current_balance=balances.get(a.id, 0),
-                balance_usd=balances_usd_vnd.get(a.id, (0, 0))[0],
-                balance_vnd=balances_usd_vnd.get(a.id, (0, 0))[1],
+                current_balance=balances.get(a.id, no_balance)[0],
+                balance_usd=balances.get(a.id, no_balance)[1],
+                balance_vnd=balances.get(a.id, no_balance)[2],
             )
-            for a in accounts
+            async for a in accounts
         ]
     )
 
@@ -1,13 +1,16 @@
 """Analytics API router — 19 endpoints for comprehensive dashboard analytics."""
 
 import uuid
+from collections.abc import Awaitable, Callable
 from datetime import datetime
 from typing import Annotated, Optional
+from urllib.parse import urlencode
 
-from fastapi import APIRouter, Depends, Query
-from sqlalchemy.ext.asyncio import AsyncSession
+from fastapi import APIRouter, Depends, Query, Request, Response
+from fastapi.routing import APIRoute
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
-from cryptotax.api.deps import get_db, resolve_entity
+from cryptotax.api.deps import get_db, get_response_cache, get_session_factory, resolve_entity
 from cryptotax.api.schemas.analytics import (
     ActivityDay,
     BalancePeriod,
@@ -35,10 +38,43 @@ from cryptotax.api.schemas.analytics import (
 from cryptotax.db.models.entity import Entity
 from cryptotax.db.repos.analytics_repo import AnalyticsRepo
 from cryptotax.db.repos.tax_analytics_repo import TaxAnalyticsRepo
+from cryptotax.infra.cache.namespaces import ANALYTICS_CACHE_NAMESPACE
 
-router = APIRouter(prefix="/api/analytics", tags=["analytics"])
+ANALYTICS_CACHE_TTL = 60
+
+
+class _CachedAnalyticsRoute(APIRoute):
+    """Serve repeat dashboard reads from the response cache.
+
+    The key is the path plus the sorted query string, so every filter combination
+    (entity, dates, wallet, granularity, ...) is cached separately. API writes that change
+    journal or tax data invalidate the whole namespace; out-of-request writes (Celery sync
+    and parse tasks) age out via the TTL.
+    """
+
+    def get_route_handler(self) -> Callable[[Request], Awaitable[Response]]:
+        handler = super().get_route_handler()
+
+        async def cached_handler(request: Request) -> Response:
+            cache = get_response_cache(request)
+            if cache is None:
+                return await handler(request)
+            key = f"{request.url.path}?{urlencode(sorted(request.query_params.multi_items()))}"
+            cached = await cache.get(ANALYTICS_CACHE_NAMESPACE, key)
+            if cached is not None:
+                return Response(content=cached, media_type="application/json")
+            response = await handler(request)
+            if response.status_code == 200:
+                await cache.set(ANALYTICS_CACHE_NAMESPACE, key, bytes(response.body).decode(), ANALYTICS_CACHE_TTL)
+            return response
+
+        return cached_handler
+
+
+router = APIRouter(prefix="/api/analytics", tags=["analytics"], route_class=_CachedAnalyticsRoute)
 
 DbDep = Annotated[AsyncSession, Depends(get_db)]
+SessionFactoryDep = Annotated[async_sessionmaker[AsyncSession], Depends(get_session_factory)]
 
 
 def _build_filters(
@@ -82,17 +118,17 @@ def _build_filters(
 @router.get("/overview", response_model=OverviewResponse)
 async def get_overview(
     db: DbDep,
+    session_factory: SessionFactoryDep,
     entity: Entity = Depends(resolve_entity),
     date_from: Optional[datetime] = Query(None),
     date_to: Optional[datetime] = Query(None),
 ) -> OverviewResponse:
     """Combined KPI + cash flow (last 12 months) + composition snapshot."""
-    repo = AnalyticsRepo(db)
+    repo = AnalyticsRepo(db, session_factory=session_factory)
     f = _build_filters(entity, date_from=date_from, date_to=date_to)
 
-    kpi_data = await repo.get_kpi_summary(**f)
-    cash_flow_data = await repo.get_cash_flow_series(granularity="month", **f)
-    composition_data = await repo.get_composition_snapshot(**f)
+    data = await repo.get_overview(**f)
+    kpi_data, cash_flow_data, composition_data = data["kpi"], data["cash_flow"], data["composition"]
 
     kpi = KPISummaryResponse(
         total_inflow_usd=_to_float(kpi_data["total_inflow_usd"]),
@@ -1,29 +1,53 @@
 from __future__ import annotations
 
 import uuid
-from typing import TYPE_CHECKING, AsyncGenerator
+from typing import AsyncGenerator
 
-if TYPE_CHECKING:
-    from cryptotax.accounting.bookkeeper import Bookkeeper
-    from cryptotax.infra.price.service import PriceService
-
-from dependency_injector.wiring import Provide, inject
-from fastapi import Depends, HTTPException, Query
+from fastapi import Depends, HTTPException, Query, Request
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
+from cryptotax.accounting.bookkeeper import Bookkeeper
+from cryptotax.config import settings
 from cryptotax.container import Container
 from cryptotax.db.models.entity import Entity
 from cryptotax.db.repos.entity_repo import EntityRepo
+from cryptotax.infra.cache.response_cache import ResponseCache
+from cryptotax.infra.cache.ttl_cache import TTLCache
+from cryptotax.infra.http.rate_limited_client import RateLimitedClient
+from cryptotax.infra.price.coingecko import CoinGeckoProvider
+from cryptotax.infra.price.cryptocompare import CryptoCompareProvider
+from cryptotax.infra.price.service import PriceService
+from cryptotax.parser.registry import build_default_registry
 
 
-@inject
-async def get_db(
-    session_factory: async_sessionmaker[AsyncSession] = Depends(Provide[Container.session_factory]),
-) -> AsyncGenerator[AsyncSession, None]:
+async def get_db(request: Request) -> AsyncGenerator[AsyncSession, None]:
+    session_factory: async_sessionmaker[AsyncSession] = request.app.state.session_factory
     async with session_factory() as session:
         yield session
 
 
+def get_session_factory(request: Request) -> async_sessionmaker[AsyncSession]:
+    """Session factory for handlers that need their own sessions (e.g. concurrent fan-out)."""
+    return request.app.state.session_factory
+
+
+def get_response_cache(request: Request) -> ResponseCache | None:
+    """Return the app's Redis response cache, or None when none is attached (e.g. tests).
+
+    Used both as a dependency and directly by route classes; tests swap it by setting
+    app.state.response_cache.
+    """
+    return getattr(request.app.state, "response_cache", None)
+
+
+def get_entity_cache(request: Request) -> TTLCache[uuid.UUID | str, uuid.UUID] | None:
+    """Return the app's resolved-entity cache, or None when no container is attached (e.g. tests)."""
+    container: Container | None = getattr(request.app.state, "container", None)
+    if container is None:
+        return None
+    return container.entity_cache()
+
+
 async def resolve_entity(
     entity_id: uuid.UUID | None = Query(None, description="Entity ID (uses default if omitted)"),
     db: AsyncSession = Depends(get_db),
@@ -39,13 +63,8 @@ async def resolve_entity(
     return entity
 
 
-def build_price_service(db: AsyncSession) -> "PriceService":
+def build_price_service(db: AsyncSession) -> PriceService:
     """Create a PriceService wired with CoinGecko + CryptoCompare fallback."""
-    from cryptotax.config import settings
-    from cryptotax.infra.http.rate_limited_client import RateLimitedClient
-    from cryptotax.infra.price.coingecko import CoinGeckoProvider
-    from cryptotax.infra.price.cryptocompare import CryptoCompareProvider
-    from cryptotax.infra.price.service import PriceService
 
     http_client = RateLimitedClient(rate_per_second=10.0, timeout=30.0)
     coingecko = CoinGeckoProvider(http_client, api_key=settings.coingecko_api_key)
@@ -53,10 +72,8 @@ def build_price_service(db: AsyncSession) -> "PriceService":
     return PriceService(db, coingecko, cryptocompare)
 
 
-def build_bookkeeper(db: AsyncSession) -> "Bookkeeper":
+def build_bookkeeper(db: AsyncSession) -> Bookkeeper:
     """Create a Bookkeeper wired with PriceService + CoinGecko."""
-    from cryptotax.accounting.bookkeeper import Bookkeeper
-    from cryptotax.parser.registry import build_default_registry
 
     price_service = build_price_service(db)
     registry = build_default_registry()
@@ -4,7 +4,7 @@ from typing import Annotated
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from cryptotax.api.deps import get_db
+from cryptotax.api.deps import get_db, get_entity_cache, get_response_cache
 from cryptotax.api.schemas.entities import (
     EntityCreateRequest,
     EntityListResponse,
@@ -12,10 +12,15 @@ from cryptotax.api.schemas.entities import (
     EntityUpdateRequest,
 )
 from cryptotax.db.repos.entity_repo import EntityRepo
+from cryptotax.infra.cache.namespaces import ANALYTICS_CACHE_NAMESPACE
+from cryptotax.infra.cache.response_cache import ResponseCache
+from cryptotax.infra.cache.ttl_cache import TTLCache
 
 router = APIRouter(prefix="/api/entities", tags=["entities"])
 
 DbDep = Annotated[AsyncSession, Depends(get_db)]
+CacheDep = Annotated[ResponseCache | None, Depends(get_response_cache)]
+EntityCacheDep = Annotated[TTLCache[uuid.UUID | str, uuid.UUID] | None, Depends(get_entity_cache)]
 
 
 @router.get("", response_model=EntityListResponse)
@@ -38,11 +43,14 @@ async def list_entities(db: DbDep) -> EntityListResponse:
 
 
 @router.post("", response_model=EntityResponse, status_code=status.HTTP_201_CREATED)
-async def create_entity(body: EntityCreateRequest, db: DbDep) -> EntityResponse:
+async def create_entity(body: EntityCreateRequest, db: DbDep, entity_cache: EntityCacheDep) -> EntityResponse:
     """Create a new entity."""
     repo = EntityRepo(db)
     entity = await repo.create(name=body.name, base_currency=body.base_currency)
     await db.commit()
+    if entity_cache is not None:
+        # The default entity may change
+        entity_cache.clear()
     await db.refresh(entity)
     return EntityResponse(
         id=entity.id,
@@ -93,10 +101,14 @@ async def update_entity(entity_id: uuid.UUID, body: EntityUpdateRequest, db: DbD
 
 
 @router.delete("/{entity_id}", status_code=status.HTTP_204_NO_CONTENT)
-async def delete_entity(entity_id: uuid.UUID, db: DbDep) -> None:
+async def delete_entity(entity_id: uuid.UUID, db: DbDep, cache: CacheDep, entity_cache: EntityCacheDep) -> None:
     """Soft-delete an entity."""
     repo = EntityRepo(db)
     deleted = await repo.soft_delete(entity_id)
     if not deleted:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Entity not found")
     await db.commit()
+    if entity_cache is not None:
+        entity_cache.clear()
+    if cache is not None:
+        await cache.invalidate(ANALYTICS_CACHE_NAMESPACE)
@@ -1,28 +1,43 @@
 import json
 import uuid
+from functools import lru_cache
 from typing import Annotated, Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from cryptotax.api.deps import get_db, resolve_entity
-from cryptotax.api.schemas.errors import ErrorSummaryResponse, ParseErrorResponse
+from cryptotax.api.deps import build_bookkeeper, get_db, get_response_cache, resolve_entity
+from cryptotax.api.schemas.errors import ErrorList, ErrorSummaryResponse, ParseErrorResponse
 from cryptotax.db.models.entity import Entity
+from cryptotax.db.models.parse_error_record import ParseErrorRecord
+from cryptotax.db.models.transaction import Transaction
+from cryptotax.db.repos.journal_repo import JournalRepo
 from cryptotax.db.repos.parse_error_repo import ParseErrorRepo
+from cryptotax.db.repos.transaction_repo import TransactionRepo
+from cryptotax.db.repos.wallet_repo import WalletRepo
+from cryptotax.domain.enums import TxStatus
+from cryptotax.infra.cache.namespaces import ANALYTICS_CACHE_NAMESPACE, STATS_CACHE_NAMESPACE
+from cryptotax.infra.cache.response_cache import ResponseCache
 
 router = APIRouter(prefix="/api/errors", tags=["errors"])
 
 DbDep = Annotated[AsyncSession, Depends(get_db)]
+CacheDep = Annotated[ResponseCache | None, Depends(get_response_cache)]
+
+
+@lru_cache(maxsize=1024)
+def _load_diagnostic(raw: str) -> dict | None:
+    """Deserialize diagnostic_data JSON, cached since the same contract/function fails repeatedly."""
+    try:
+        return json.loads(raw)
+    except (json.JSONDecodeError, TypeError):
+        return None
 
 
 def _to_response(e, tx_hash: str | None = None, chain: str | None = None) -> ParseErrorResponse:
     """Convert a ParseErrorRecord to response, deserializing diagnostic_data JSON."""
-    diag = None
-    if e.diagnostic_data:
-        try:
-            diag = json.loads(e.diagnostic_data)
-        except (json.JSONDecodeError, TypeError):
-            pass
+    diag = _load_diagnostic(e.diagnostic_data) if e.diagnostic_data else None
 
     return ParseErrorResponse(
         id=e.id,
@@ -39,7 +54,7 @@ def _to_response(e, tx_hash: str | None = None, chain: str | None = None) -> Par
     )
 
 
-@router.get("")
+@router.get("", response_model=ErrorList)
 async def list_errors(
     db: DbDep,
     entity_id: Optional[uuid.UUID] = Query(None, description="Filter errors by entity"),
@@ -49,17 +64,18 @@ async def list_errors(
     function_selector: Optional[str] = Query(None),
     limit: int = Query(50, ge=1, le=200),
     offset: int = Query(0, ge=0),
-):
+) -> ErrorList:
     repo = ParseErrorRepo(db)
     rows, total = await repo.list_errors(
         error_type=error_type, resolved=resolved, entity_id=entity_id, limit=limit, offset=offset,
     )
-    return {
-        "errors": [_to_response(e, tx_hash, chain).model_dump(mode="json") for e, tx_hash, chain in rows],
-        "total": total,
-        "limit": limit,
-        "offset": offset,
-    }
+    to_response = _to_response
+    return ErrorList(
+        errors=[to_response(e, tx_hash, chain) for e, tx_hash, chain in rows],
+        total=total,
+        limit=limit,
+        offset=offset,
+    )
 
 
 @router.get("/summary", response_model=ErrorSummaryResponse)
@@ -75,16 +91,12 @@ async def error_summary(
 @router.post("/retry-group")
 async def retry_error_group(
     db: DbDep,
+    cache: CacheDep,
     entity: Entity = Depends(resolve_entity),
     contract_address: Optional[str] = Query(None),
     function_selector: Optional[str] = Query(None),
 ) -> dict:
     """Bulk re-parse all error TXs matching a contract/function filter."""
-    from cryptotax.api.deps import build_bookkeeper
-    from cryptotax.db.repos.journal_repo import JournalRepo
-    from cryptotax.db.repos.transaction_repo import TransactionRepo
-    from cryptotax.db.repos.wallet_repo import WalletRepo
-    from cryptotax.domain.enums import TxStatus
 
     repo = ParseErrorRepo(db)
     errors = await repo.list_by_diagnostic_filter(
@@ -123,19 +135,17 @@ async def retry_error_group(
             failed += 1
 
     await db.commit()
+    if cache is not None:
+        await cache.invalidate(STATS_CACHE_NAMESPACE)
+        await cache.invalidate(ANALYTICS_CACHE_NAMESPACE)
     return {"retried": success + failed, "success": success, "failed": failed}
 
 
 @router.post("/{error_id}/retry")
-async def retry_error(error_id: uuid.UUID, db: DbDep, entity: Entity = Depends(resolve_entity)) -> dict:
+async def retry_error(
+    error_id: uuid.UUID, db: DbDep, cache: CacheDep, entity: Entity = Depends(resolve_entity)
+) -> dict:
     """Re-parse the transaction associated with this error."""
-    from cryptotax.api.deps import build_bookkeeper
-    from cryptotax.db.models.parse_error_record import ParseErrorRecord
-    from cryptotax.db.repos.journal_repo import JournalRepo
-    from cryptotax.db.repos.transaction_repo import TransactionRepo
-    from cryptotax.db.repos.wallet_repo import WalletRepo
-    from cryptotax.domain.enums import TxStatus
-    from sqlalchemy import select
 
     stmt = select(ParseErrorRecord).where(ParseErrorRecord.id == error_id)
     result = await db.execute(stmt)
@@ -165,17 +175,16 @@ async def retry_error(error_id: uuid.UUID, db: DbDep, entity: Entity = Depends(r
     bookkeeper = build_bookkeeper(db)
     entry = await bookkeeper.process_transaction(tx, wallet, entity.id)
     await db.commit()
+    if cache is not None:
+        await cache.invalidate(STATS_CACHE_NAMESPACE)
+        await cache.invalidate(ANALYTICS_CACHE_NAMESPACE)
 
     return {"status": "ok" if entry else "error", "entry_type": entry.entry_type if entry else None}
 
 
 @router.post("/{error_id}/ignore")
-async def ignore_error(error_id: uuid.UUID, db: DbDep) -> dict:
+async def ignore_error(error_id: uuid.UUID, db: DbDep, cache: CacheDep) -> dict:
     """Mark error as resolved and TX as IGNORED."""
-    from cryptotax.db.models.parse_error_record import ParseErrorRecord
-    from cryptotax.db.models.transaction import Transaction
-    from cryptotax.domain.enums import TxStatus
-    from sqlalchemy import select
 
     result = await db.execute(select(ParseErrorRecord).where(ParseErrorRecord.id == error_id))
     error_record = result.scalar_one_or_none()
@@ -191,4 +200,7 @@ async def ignore_error(error_id: uuid.UUID, db: DbDep) -> dict:
             tx.status = TxStatus.IGNORED.value
 
     await db.commit()
+    if cache is not None:
+        await cache.invalidate(STATS_CACHE_NAMESPACE)
+        await cache.invalidate(ANALYTICS_CACHE_NAMESPACE)
     return {"status": "ok"}
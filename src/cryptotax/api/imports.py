@@ -9,7 +9,7 @@ from fastapi import APIRouter, Depends, File, Form, HTTPException, Query, Upload
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from cryptotax.api.deps import get_db, resolve_entity
+from cryptotax.api.deps import get_db, get_response_cache, resolve_entity
 from cryptotax.api.schemas.imports import (
     CsvImportDetailResponse,
     CsvImportListResponse,
@@ -22,13 +22,20 @@ from cryptotax.api.schemas.imports import (
 from cryptotax.db.models.entity import Entity
 from cryptotax.db.models.wallet import CEXWallet
 from cryptotax.db.repos.csv_import_repo import CsvImportRepo
+from cryptotax.infra.cache.namespaces import ANALYTICS_CACHE_NAMESPACE, STATS_CACHE_NAMESPACE
+from cryptotax.infra.cache.response_cache import ResponseCache
+from cryptotax.infra.cache.ttl_cache import TTLCache
 from cryptotax.parser.cex.binance_csv import BinanceCsvParser
 
 router = APIRouter(prefix="/api/imports", tags=["imports"])
 
 DbDep = Annotated[AsyncSession, Depends(get_db)]
+CacheDep = Annotated[ResponseCache | None, Depends(get_response_cache)]
 
-REQUIRED_COLUMNS = {"UTC_Time", "Account", "Operation", "Coin", "Change"}
+# (entity_id, exchange) -> CEXWallet.id, so repeated imports skip the wallet SELECT
+_cex_wallet_cache: TTLCache[tuple[uuid.UUID, str], uuid.UUID] = TTLCache(maxsize=1024, ttl=300)
+
+REQUIRED_COLUMNS: frozenset[str] = frozenset({"UTC_Time", "Account", "Operation", "Coin", "Change"})
 
 
 @router.post("/upload", response_model=UploadResponse)
@@ -55,8 +62,7 @@ async def upload_csv(
         raise HTTPException(status_code=400, detail="CSV file is empty or has no header")
 
     # Validate required columns
-    actual_columns = set(reader.fieldnames)
-    missing = REQUIRED_COLUMNS - actual_columns
+    missing = REQUIRED_COLUMNS.difference(reader.fieldnames)
     if missing:
         raise HTTPException(
             status_code=400,
@@ -218,7 +224,7 @@ async def get_import_summary(import_id: uuid.UUID, db: DbDep) -> ImportSummaryRe
 
 
 @router.post("/{import_id}/parse", response_model=ParseImportResponse)
-async def parse_import(import_id: uuid.UUID, db: DbDep) -> ParseImportResponse:
+async def parse_import(import_id: uuid.UUID, db: DbDep, cache: CacheDep) -> ParseImportResponse:
     """Trigger parsing of a CSV import's rows into journal entries."""
     repo = CsvImportRepo(db)
     csv_import = await repo.get_by_id(import_id)
@@ -242,6 +248,9 @@ async def parse_import(import_id: uuid.UUID, db: DbDep) -> ParseImportResponse:
     final_status = "completed"
     await repo.update_status(csv_import.id, final_status, parsed_count=stats.parsed, error_count=stats.errors)
     await db.commit()
+    if cache is not None:
+        await cache.invalidate(STATS_CACHE_NAMESPACE)
+        await cache.invalidate(ANALYTICS_CACHE_NAMESPACE)
 
     return ParseImportResponse(
         import_id=csv_import.id,
@@ -256,6 +265,14 @@ async def _get_or_create_cex_wallet(
     db: AsyncSession, entity_id: uuid.UUID, exchange: str
 ) -> CEXWallet:
     """Get or create a CEX wallet for this entity+exchange combo."""
+    cache_key = (entity_id, exchange)
+    wallet_id = _cex_wallet_cache.get(cache_key)
+    if wallet_id is not None:
+        wallet = await db.get(CEXWallet, wallet_id)
+        if wallet is not None:
+            return wallet
+        _cex_wallet_cache.pop(cache_key)
+
     result = await db.execute(
         select(CEXWallet).where(
             CEXWallet.entity_id == entity_id,
@@ -272,4 +289,5 @@ async def _get_or_create_cex_wallet(
         )
         db.add(wallet)
         await db.flush()
+    _cex_wallet_cache.set(cache_key, wallet.id)
     return wallet
@@ -3,20 +3,26 @@ from datetime import datetime
 from typing import Annotated, Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query
+from pydantic import TypeAdapter
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from cryptotax.api.deps import build_price_service, get_db, resolve_entity
+from cryptotax.api.deps import build_price_service, get_db, get_response_cache, resolve_entity
 from cryptotax.api.schemas.journal import JournalEntryDetail, JournalEntryResponse, JournalList, JournalSplitResponse
 from cryptotax.db.models.account import Account
 from cryptotax.db.models.entity import Entity
 from cryptotax.db.models.journal import JournalEntry, JournalSplit
 from cryptotax.db.models.wallet import Wallet
 from cryptotax.db.repos.journal_repo import JournalRepo
+from cryptotax.infra.cache.namespaces import ANALYTICS_CACHE_NAMESPACE
+from cryptotax.infra.cache.response_cache import ResponseCache
 
 router = APIRouter(prefix="/api/journal", tags=["journal"])
 
 DbDep = Annotated[AsyncSession, Depends(get_db)]
+CacheDep = Annotated[ResponseCache | None, Depends(get_response_cache)]
+
+_ENTRY_LIST_ADAPTER = TypeAdapter(list[JournalEntryResponse])
 
 
 @router.get("", response_model=JournalList)
@@ -50,7 +56,7 @@ async def list_journal(
     )
 
     return JournalList(
-        entries=[JournalEntryResponse.model_validate(e) for e in entries],
+        entries=_ENTRY_LIST_ADAPTER.validate_python(entries, from_attributes=True),
         total=total,
         limit=limit,
         offset=offset,
@@ -61,7 +67,7 @@ async def list_journal(
 async def list_unbalanced(db: DbDep, entity: Entity = Depends(resolve_entity)) -> list[JournalEntryResponse]:
     journal_repo = JournalRepo(db)
     entries = await journal_repo.list_unbalanced(entity.id)
-    return [JournalEntryResponse.model_validate(e) for e in entries]
+    return _ENTRY_LIST_ADAPTER.validate_python(entries, from_attributes=True)
 
 
 @router.get("/{entry_id}", response_model=JournalEntryDetail)
@@ -71,12 +77,18 @@ async def get_journal_entry(entry_id: uuid.UUID, db: DbDep) -> JournalEntryDetai
     if entry is None:
         raise HTTPException(status_code=404, detail="Journal entry not found")
 
-    # Build splits with account info
+    # Build splits with account info — one IN query instead of a lookup per split
+    account_ids = {split.account_id for split in entry.splits}
+    accounts: dict[uuid.UUID, Account] = {}
+    if account_ids:
+        result = await db.execute(select(Account).where(Account.id.in_(account_ids)))
+        accounts = {a.id: a for a in result.scalars().all()}
+
+    # Split columns are already typed Decimal/UUID from the ORM — skip per-field re-validation
     splits_response = []
     for split in entry.splits:
-        result = await db.execute(select(Account).where(Account.id == split.account_id))
-        account = result.scalar_one_or_none()
-        splits_response.append(JournalSplitResponse(
+        account = accounts.get(split.account_id)
+        splits_response.append(JournalSplitResponse.model_construct(
             id=split.id,
             account_id=split.account_id,
             account_label=account.label if account else None,
@@ -102,6 +114,7 @@ async def get_journal_entry(entry_id: uuid.UUID, db: DbDep) -> JournalEntryDetai
 @router.post("/reprice")
 async def reprice_splits(
     db: DbDep,
+    cache: CacheDep,
     entity: Entity = Depends(resolve_entity),
 ) -> dict:
     """Backfill value_usd/value_vnd for splits that have NULL prices.
@@ -110,9 +123,9 @@ async def reprice_splits(
     """
     price_service = build_price_service(db)
 
-    # Find all splits with NULL value_usd for this entity
+    # Find all splits with NULL value_usd for this entity, with the account symbol and entry timestamp
     stmt = (
-        select(JournalSplit)
+        select(JournalSplit, Account.symbol, JournalEntry.timestamp)
         .join(JournalEntry, JournalSplit.journal_entry_id == JournalEntry.id)
         .join(Account, JournalSplit.account_id == Account.id)
         .join(Wallet, Account.wallet_id == Wallet.id)
@@ -120,40 +133,37 @@ async def reprice_splits(
         .where(JournalSplit.value_usd.is_(None))
     )
     result = await db.execute(stmt)
-    splits = result.scalars().all()
+    rows = result.all()
 
-    if not splits:
+    if not rows:
         return {"updated": 0, "still_null": 0, "total_null_before": 0, "unmapped_symbols": []}
 
-    total_before = len(splits)
+    total_before = len(rows)
     updated = 0
     unmapped: set[str] = set()
 
-    # Batch: collect (split, account, entry) for pricing
-    for split in splits:
-        # Load account for symbol
-        acc_result = await db.execute(select(Account).where(Account.id == split.account_id))
-        account = acc_result.scalar_one_or_none()
-        if not account or not account.symbol:
-            continue
-
-        # Load journal entry for timestamp
-        entry_result = await db.execute(select(JournalEntry).where(JournalEntry.id == split.journal_entry_id))
-        entry = entry_result.scalar_one_or_none()
-        if not entry or not entry.timestamp:
+    to_price: list[tuple[JournalSplit, str, int]] = []
+    for split, symbol, entry_ts in rows:
+        if not symbol or not entry_ts:
             continue
+        timestamp = int(entry_ts.timestamp()) if hasattr(entry_ts, 'timestamp') else int(entry_ts)
+        to_price.append((split, symbol, timestamp))
 
-        timestamp = int(entry.timestamp.timestamp()) if hasattr(entry.timestamp, 'timestamp') else int(entry.timestamp)
+    # One cache query for every (symbol, hour) instead of one per split
+    await price_service.prefetch((symbol, timestamp) for _, symbol, timestamp in to_price)
 
-        value_usd, value_vnd = await price_service.price_split(account.symbol, split.quantity, timestamp)
+    for split, symbol, timestamp in to_price:
+        value_usd, value_vnd = await price_service.price_split(symbol, split.quantity, timestamp)
         if value_usd is not None:
             split.value_usd = value_usd
             split.value_vnd = value_vnd
             updated += 1
         else:
-            unmapped.add(account.symbol)
+            unmapped.add(symbol)
 
     await db.commit()
+    if cache is not None:
+        await cache.invalidate(ANALYTICS_CACHE_NAMESPACE)
 
     return {
         "updated": updated,
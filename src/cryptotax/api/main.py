@@ -1,9 +1,9 @@
 import logging
-import traceback
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from sqlalchemy.exc import SQLAlchemyError
 from starlette.requests import Request
 from starlette.responses import JSONResponse
 
@@ -19,6 +19,7 @@ from cryptotax.api.tax import router as tax_router
 from cryptotax.api.transactions import router as transactions_router
 from cryptotax.api.wallets import router as wallets_router
 from cryptotax.container import Container
+from cryptotax.db.session import warm_pool
 
 logger = logging.getLogger("cryptotax.api")
 
@@ -27,9 +28,17 @@ logger = logging.getLogger("cryptotax.api")
 async def lifespan(app: FastAPI):
     container = Container()
     app.state.container = container
-    yield
+    # Resolved once here so get_db reads a plain attribute instead of going through provider wiring
+    app.state.session_factory = container.session_factory()
+    app.state.response_cache = container.response_cache()
     engine = container.engine()
+    try:
+        await warm_pool(engine, container.settings().db_pool_size)
+    except (OSError, SQLAlchemyError):
+        logger.warning("Database pool warm-up failed; connections will be opened on demand", exc_info=True)
+    yield
     await engine.dispose()
+    await container.redis_client().aclose()
 
 
 app = FastAPI(title="LeafJots", version="0.1.0", lifespan=lifespan)
@@ -37,8 +46,7 @@ app = FastAPI(title="LeafJots", version="0.1.0", lifespan=lifespan)
 
 @app.exception_handler(Exception)
 async def global_exception_handler(request: Request, exc: Exception):
-    tb = traceback.format_exception(type(exc), exc, exc.__traceback__)
-    logger.error("Unhandled error on %s %s:\n%s", request.method, request.url.path, "".join(tb))
+    logger.exception("Unhandled error on %s %s", request.method, request.url.path, exc_info=exc)
     return JSONResponse(status_code=500, content={"detail": str(exc)})
 
 
@@ -64,5 +72,5 @@ app.include_router(imports_router)
 
 
 @app.get("/api/health")
-async def health():
+async def health() -> dict[str, str]:
     return {"status": "ok", "version": "0.1.0"}
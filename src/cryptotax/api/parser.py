@@ -1,39 +1,75 @@
 import uuid
 from typing import Annotated, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from cryptotax.api.deps import build_bookkeeper, get_db, resolve_entity
+from cryptotax.api.deps import build_bookkeeper, get_db, get_response_cache, resolve_entity
 from cryptotax.api.schemas.parse import ParseStatsResponse, ParseTestRequest, ParseTestResponse, ParseWalletResponse, ParsedSplitResponse
+from cryptotax.db.models.account import Account
 from cryptotax.db.models.entity import Entity
 from cryptotax.db.models.transaction import Transaction
+from cryptotax.db.models.wallet import Wallet
 from cryptotax.db.repos.transaction_repo import TransactionRepo
 from cryptotax.db.repos.wallet_repo import WalletRepo
 from cryptotax.domain.enums import TxStatus
+from cryptotax.infra.cache.namespaces import ANALYTICS_CACHE_NAMESPACE, STATS_CACHE_NAMESPACE
+from cryptotax.infra.cache.response_cache import ResponseCache
+from cryptotax.infra.cache.ttl_cache import TTLCache
 
 router = APIRouter(prefix="/api/parse", tags=["parser"])
 
 DbDep = Annotated[AsyncSession, Depends(get_db)]
+CacheDep = Annotated[ResponseCache | None, Depends(get_response_cache)]
+
+STATS_CACHE_TTL = 15
+
+# account_id -> (label, account_type, symbol); accounts are never edited after creation
+_account_info_cache: TTLCache[uuid.UUID, tuple[str, str, str]] = TTLCache(maxsize=10_000, ttl=300)
+
+
+async def _account_info(db: AsyncSession, account_ids: set[uuid.UUID]) -> dict[uuid.UUID, tuple[str, str, str]]:
+    """Resolve display fields for accounts, querying only ids missing from the shared cache."""
+    info: dict[uuid.UUID, tuple[str, str, str]] = {}
+    misses = []
+    for account_id in account_ids:
+        cached = _account_info_cache.get(account_id)
+        if cached is None:
+            misses.append(account_id)
+        else:
+            info[account_id] = cached
+
+    if misses:
+        rows = await db.execute(
+            select(Account.id, Account.label, Account.account_type, Account.symbol).where(Account.id.in_(misses))
+        )
+        for account_id, label, account_type, symbol in rows:
+            info[account_id] = (label, account_type, symbol)
+            _account_info_cache.set(account_id, info[account_id])
+    return info
 
 
 @router.post("/test", response_model=ParseTestResponse)
-async def parse_test(body: ParseTestRequest, db: DbDep, entity: Entity = Depends(resolve_entity)) -> ParseTestResponse:
+async def parse_test(
+    body: ParseTestRequest, db: DbDep, cache: CacheDep, entity: Entity = Depends(resolve_entity)
+) -> ParseTestResponse:
     """Parse a single transaction by hash (dry-run or real persist)."""
     tx_repo = TransactionRepo(db)
-    tx = await tx_repo.get_by_hash(body.tx_hash)
-    if tx is None:
+    found = await tx_repo.get_by_hash_with_wallet(body.tx_hash)
+    if found is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Transaction not found")
 
-    wallet_repo = WalletRepo(db)
-    wallet = await wallet_repo.get_by_id(tx.wallet_id)
+    tx, wallet = found
     if wallet is None:
         raise HTTPException(status_code=404, detail="Wallet not found for this transaction")
 
     bookkeeper = build_bookkeeper(db)
     entry = await bookkeeper.process_transaction(tx, wallet, entity.id)
     await db.commit()
+    if cache is not None:
+        await cache.invalidate(STATS_CACHE_NAMESPACE)
+        await cache.invalidate(ANALYTICS_CACHE_NAMESPACE)
 
     if entry is None:
         return ParseTestResponse(
@@ -45,17 +81,16 @@ async def parse_test(body: ParseTestRequest, db: DbDep, entity: Entity = Depends
             warnings=["Failed to parse transaction — check /errors for details"],
         )
 
-    # entry.splits already loaded via refresh in bookkeeper
+    # entry.splits is eager-loaded by the bookkeeper
+    accounts = await _account_info(db, {split.account_id for split in entry.splits})
+    unknown = ("unknown", "unknown", "unknown")
     splits = []
     for split in entry.splits:
-        # Load account for display
-        from cryptotax.db.models.account import Account
-        result = await db.execute(select(Account).where(Account.id == split.account_id))
-        account = result.scalar_one_or_none()
+        label, account_type, symbol = accounts.get(split.account_id, unknown)
         splits.append(ParsedSplitResponse(
-            account_label=account.label if account else "unknown",
-            account_type=account.account_type if account else "unknown",
-            symbol=account.symbol if account else "unknown",
+            account_label=label,
+            account_type=account_type,
+            symbol=symbol,
             quantity=split.quantity,
         ))
 
@@ -70,7 +105,9 @@ async def parse_test(body: ParseTestRequest, db: DbDep, entity: Entity = Depends
 
 
 @router.post("/wallet/{wallet_id}", response_model=ParseWalletResponse)
-async def parse_wallet(wallet_id: uuid.UUID, db: DbDep, entity: Entity = Depends(resolve_entity)) -> ParseWalletResponse:
+async def parse_wallet(
+    wallet_id: uuid.UUID, db: DbDep, cache: CacheDep, entity: Entity = Depends(resolve_entity)
+) -> ParseWalletResponse:
     """Parse all LOADED transactions for a wallet."""
     wallet_repo = WalletRepo(db)
     wallet = await wallet_repo.get_by_id(wallet_id)
@@ -80,6 +117,9 @@ async def parse_wallet(wallet_id: uuid.UUID, db: DbDep, entity: Entity = Depends
     bookkeeper = build_bookkeeper(db)
     stats = await bookkeeper.process_wallet(wallet, entity.id)
     await db.commit()
+    if cache is not None:
+        await cache.invalidate(STATS_CACHE_NAMESPACE)
+        await cache.invalidate(ANALYTICS_CACHE_NAMESPACE)
 
     return ParseWalletResponse(**stats)
 
@@ -87,21 +127,27 @@ async def parse_wallet(wallet_id: uuid.UUID, db: DbDep, entity: Entity = Depends
 @router.get("/stats", response_model=ParseStatsResponse)
 async def parse_stats(
     db: DbDep,
+    cache: CacheDep,
     entity_id: Optional[uuid.UUID] = Query(None, description="Entity ID to scope stats (all entities if omitted)"),
-) -> ParseStatsResponse:
+) -> ParseStatsResponse | Response:
     """Get parsing statistics across all transactions, optionally scoped by entity."""
-    from cryptotax.db.models.wallet import Wallet
-
-    base = select(Transaction.status, func.count()).group_by(Transaction.status)
+    cache_key = str(entity_id) if entity_id is not None else "all"
+    if cache is not None:
+        cached = await cache.get(STATS_CACHE_NAMESPACE, cache_key)
+        if cached is not None:
+            return Response(content=cached, media_type="application/json")
+
+    stmt = select(
+        func.count().label("total"),
+        func.count().filter(Transaction.status == TxStatus.PARSED.value).label("parsed"),
+        func.count().filter(Transaction.status == TxStatus.ERROR.value).label("errors"),
+        func.count().filter(Transaction.status == TxStatus.LOADED.value).label("unknown"),
+    ).select_from(Transaction)
     if entity_id is not None:
-        base = base.join(Wallet, Transaction.wallet_id == Wallet.id).where(Wallet.entity_id == entity_id)
-
-    result = await db.execute(base)
-    counts = dict(result.all())
-
-    total = sum(counts.values())
-    parsed = counts.get(TxStatus.PARSED.value, 0)
-    errors = counts.get(TxStatus.ERROR.value, 0)
-    unknown = counts.get(TxStatus.LOADED.value, 0)
+        stmt = stmt.join(Wallet, Transaction.wallet_id == Wallet.id).where(Wallet.entity_id == entity_id)
 
-    return ParseStatsResponse(total=total, parsed=parsed, errors=errors, unknown=unknown)
+    row = (await db.execute(stmt)).one()
+    stats = ParseStatsResponse(**row._mapping)
+    if cache is not None:
+        await cache.set(STATS_CACHE_NAMESPACE, cache_key, stats.model_dump_json(), STATS_CACHE_TTL)
+    return stats
@@ -1,49 +1,184 @@
-"""Reports API — generate and stream bangketoan.xlsx on-demand."""
+"""Reports API — generate bangketoan.xlsx, list history, and download."""
 
+import asyncio
+import uuid
+from collections.abc import AsyncIterator
 from datetime import datetime
-from typing import Annotated
+from io import BytesIO
+from typing import Annotated, Optional
 
-from fastapi import APIRouter, Depends, HTTPException
-from fastapi.responses import StreamingResponse
-from sqlalchemy.ext.asyncio import AsyncSession
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from fastapi.responses import FileResponse, StreamingResponse
+from pydantic import TypeAdapter
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
-from cryptotax.api.deps import get_db
-from cryptotax.api.schemas.reports import ReportGenerateRequest
+from cryptotax.api.deps import get_db, get_entity_cache, get_response_cache, get_session_factory
+from cryptotax.api.schemas.reports import BatchReportRequest, ReportGenerateRequest, ReportResponse
+from cryptotax.config import settings
+from cryptotax.db.models.report import ReportRecord
 from cryptotax.db.repos.entity_repo import EntityRepo
+from cryptotax.infra.cache.response_cache import ResponseCache
+from cryptotax.infra.cache.ttl_cache import TTLCache
 from cryptotax.report.service import ReportService
 
 router = APIRouter(prefix="/api/reports", tags=["reports"])
 
 DbDep = Annotated[AsyncSession, Depends(get_db)]
+CacheDep = Annotated[ResponseCache | None, Depends(get_response_cache)]
+EntityCacheDep = Annotated[TTLCache[uuid.UUID | str, uuid.UUID] | None, Depends(get_entity_cache)]
+SessionFactoryDep = Annotated[async_sessionmaker[AsyncSession], Depends(get_session_factory)]
 
 XLSX_CONTENT_TYPE = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+CHUNK_SIZE = 64 * 1024
 
+LIST_CACHE_NAMESPACE = "reports"
+LIST_CACHE_TTL = 30
+_REPORT_LIST_ADAPTER = TypeAdapter(list[ReportResponse])
 
-@router.post("/download")
-async def download_report(body: ReportGenerateRequest, db: DbDep):
-    """Generate bangketoan.xlsx from DB and stream it — no file saved to disk."""
-    entity_repo = EntityRepo(db)
 
-    if body.entity_id:
-        entity = await entity_repo.get_by_id(body.entity_id)
-    else:
-        entity = await entity_repo.get_default()
+async def _iter_buffer(buf: BytesIO) -> AsyncIterator[bytes]:
+    while chunk := buf.read(CHUNK_SIZE):
+        yield chunk
+
+
+def _xlsx_headers(filename: str, size: int) -> dict[str, str]:
+    return {
+        "Content-Disposition": f'attachment; filename="{filename}"',
+        "Content-Length": str(size),
+    }
+
+
+def _to_response(record: ReportRecord) -> ReportResponse:
+    # Built from our own ORM row — skip validation
+    return ReportResponse.model_construct(
+        id=record.id,
+        entity_id=record.entity_id,
+        period_start=record.period_start,
+        period_end=record.period_end,
+        status=record.status,
+        filename=record.filename,
+        generated_at=record.generated_at,
+        error_message=record.error_message,
+    )
+
+
+async def _resolve_period(
+    body: ReportGenerateRequest, db: AsyncSession, cache: TTLCache[uuid.UUID | str, uuid.UUID] | None = None
+) -> tuple[uuid.UUID, datetime, datetime]:
+    cache_key = body.entity_id or "default"
+    entity_id = cache.get(cache_key) if cache is not None else None
+    if entity_id is None:
+        entity_repo = EntityRepo(db)
+
+        if body.entity_id:
+            entity = await entity_repo.get_by_id(body.entity_id)
+        else:
+            entity = await entity_repo.get_default()
+
+        if entity is None:
+            raise HTTPException(status_code=404, detail="Entity not found")
+
+        entity_id = entity.id
+        if cache is not None:
+            cache.set(cache_key, entity_id)
+
+    return entity_id, body.start_date, body.end_date
+
+
+@router.post("/generate", response_model=ReportResponse)
+async def generate_report(
+    body: ReportGenerateRequest, db: DbDep, cache: CacheDep, entity_cache: EntityCacheDep
+) -> ReportResponse:
+    """Generate bangketoan.xlsx, save it under reports/, and record its metadata."""
+    entity_id, start, end = await _resolve_period(body, db, entity_cache)
+
+    service = ReportService(db)
+    record = await service.generate(entity_id, start, end)
+    await db.commit()
+    if cache is not None:
+        await cache.invalidate(LIST_CACHE_NAMESPACE)
+    return _to_response(record)
+
 
-    if entity is None:
-        raise HTTPException(status_code=404, detail="Entity not found")
+@router.post("/generate-batch", response_model=list[ReportResponse])
+async def generate_report_batch(
+    body: BatchReportRequest,
+    db: DbDep,
+    session_factory: SessionFactoryDep,
+    cache: CacheDep,
+    entity_cache: EntityCacheDep,
+) -> list[ReportResponse]:
+    """Generate several reports concurrently — one session per report, bounded by half the DB pool."""
+    periods = [await _resolve_period(item, db, entity_cache) for item in body.items]
+    semaphore = asyncio.Semaphore(max(1, settings.db_pool_size // 2))
 
-    try:
-        start = datetime.fromisoformat(body.start_date).replace(tzinfo=None)
-        end = datetime.fromisoformat(body.end_date).replace(hour=23, minute=59, second=59, tzinfo=None)
-    except ValueError as e:
-        raise HTTPException(status_code=400, detail=f"Invalid date format: {e}")
+    async def _generate(entity_id: uuid.UUID, start, end) -> ReportResponse:
+        async with semaphore, session_factory() as session:
+            record = await ReportService(session).generate(entity_id, start, end)
+            await session.commit()
+            return _to_response(record)
+
+    reports = await asyncio.gather(*(_generate(entity_id, start, end) for entity_id, start, end in periods))
+    if cache is not None:
+        await cache.invalidate(LIST_CACHE_NAMESPACE)
+    return list(reports)
+
+
+@router.get("", response_model=list[ReportResponse])
+async def list_reports(
+    db: DbDep,
+    cache: CacheDep,
+    entity_id: Optional[uuid.UUID] = Query(None, description="Filter reports by entity"),
+) -> list[ReportResponse] | Response:
+    cache_key = str(entity_id) if entity_id is not None else "all"
+    if cache is not None:
+        cached = await cache.get(LIST_CACHE_NAMESPACE, cache_key)
+        if cached is not None:
+            return Response(content=cached, media_type="application/json")
+
+    service = ReportService(db)
+    records = await service.list_reports(entity_id)
+    reports = [_to_response(r) for r in records]
+    if cache is not None:
+        await cache.set(LIST_CACHE_NAMESPACE, cache_key, _REPORT_LIST_ADAPTER.dump_json(reports).decode(), LIST_CACHE_TTL)
+    return reports
+
+
+@router.get("/{report_id}/status", response_model=ReportResponse)
+async def report_status(report_id: uuid.UUID, db: DbDep) -> ReportResponse:
+    service = ReportService(db)
+    record = await service.get_report(report_id)
+    if record is None:
+        raise HTTPException(status_code=404, detail="Report not found")
+    return _to_response(record)
+
+
+@router.get("/{report_id}/download")
+async def download_generated_report(report_id: uuid.UUID, db: DbDep):
+    """Serve a previously generated report from disk (sendfile where the server supports it)."""
+    service = ReportService(db)
+    record = await service.get_report(report_id)
+    if record is None:
+        raise HTTPException(status_code=404, detail="Report not found")
+
+    file_path = await asyncio.to_thread(service.get_file_path, record)
+    if file_path is None:
+        raise HTTPException(status_code=404, detail="Report file not available")
+
+    return FileResponse(file_path, media_type=XLSX_CONTENT_TYPE, filename=record.filename)
+
+
+@router.post("/download")
+async def download_report(body: ReportGenerateRequest, db: DbDep, entity_cache: EntityCacheDep):
+    """Generate bangketoan.xlsx from DB and stream it — no file saved to disk."""
+    entity_id, start, end = await _resolve_period(body, db, entity_cache)
 
     service = ReportService(db)
-    buf = await service.generate_buffer(entity.id, start, end)
+    buf = await service.generate_buffer(entity_id, start, end)
 
     filename = f"bangketoan_{start.strftime('%Y%m%d')}_{end.strftime('%Y%m%d')}.xlsx"
     return StreamingResponse(
-        buf,
+        _iter_buffer(buf),
         media_type=XLSX_CONTENT_TYPE,
-        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+        headers=_xlsx_headers(filename, buf.getbuffer().nbytes),
     )
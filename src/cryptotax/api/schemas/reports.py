@@ -2,15 +2,62 @@
 
 import uuid
 from datetime import datetime
+from functools import lru_cache
 from typing import Optional
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field, field_validator
+
+
+@lru_cache(maxsize=1024)
+def _parse_period_bound(raw: str, end_of_day: bool) -> datetime:
+    """Parse an ISO date/datetime string into a naive period bound (datetimes are immutable, so safe to share)."""
+    value = datetime.fromisoformat(raw)
+    if end_of_day:
+        value = value.replace(hour=23, minute=59, second=59)
+    return value.replace(tzinfo=None)
+
+
+def _parse_or_passthrough(v: object, end_of_day: bool) -> object:
+    # Dashboards poll with the same few period strings; anything fromisoformat rejects is left to pydantic
+    if isinstance(v, str):
+        try:
+            return _parse_period_bound(v, end_of_day)
+        except ValueError:
+            return v
+    return v
 
 
 class ReportGenerateRequest(BaseModel):
     entity_id: Optional[uuid.UUID] = None
-    start_date: str
-    end_date: str
+    start_date: datetime
+    end_date: datetime
+
+    @field_validator("start_date", mode="before")
+    @classmethod
+    def parse_start(cls, v: object) -> object:
+        return _parse_or_passthrough(v, end_of_day=False)
+
+    @field_validator("end_date", mode="before")
+    @classmethod
+    def parse_end(cls, v: object) -> object:
+        return _parse_or_passthrough(v, end_of_day=True)
+
+    @field_validator("start_date")
+    @classmethod
+    def naive_start(cls, v: datetime) -> datetime:
+        # Leave already-normalized values untouched so cached bounds are shared, not copied
+        return v if v.tzinfo is None else v.replace(tzinfo=None)
+
+    @field_validator("end_date")
+    @classmethod
+    def naive_end_of_day(cls, v: datetime) -> datetime:
+        if v.tzinfo is None and (v.hour, v.minute, v.second) == (23, 59, 59):
+            return v
+        return v.replace(hour=23, minute=59, second=59, tzinfo=None)
+
+
+class BatchReportRequest(BaseModel):
+    items: list[ReportGenerateRequest] = Field(min_length=1, max_length=50)
 
 
 class ReportResponse(BaseModel):
@@ -4,21 +4,33 @@ import uuid
 from datetime import datetime
 from decimal import Decimal
 
-from pydantic import BaseModel
+from pydantic import BaseModel, field_validator
 
 
 class TaxCalculateRequest(BaseModel):
     entity_id: uuid.UUID | None = None  # None = use default entity
-    start_date: str  # ISO format: "2025-01-01"
-    end_date: str  # ISO format: "2025-12-31"
+    start_date: datetime  # ISO format: "2025-01-01"
+    end_date: datetime  # ISO format: "2025-12-31"; always covers the whole day
 
+    @field_validator("start_date")
+    @classmethod
+    def naive_start(cls, v: datetime) -> datetime:
+        return v.replace(tzinfo=None)
 
+    @field_validator("end_date")
+    @classmethod
+    def naive_end_of_day(cls, v: datetime) -> datetime:
+        return v.replace(hour=23, minute=59, second=59, tzinfo=None)
+
+
+# Per-lot figures are display values — float keeps large lot lists cheap to validate/serialize.
+# TaxSummaryResponse totals stay Decimal since they are the tax-critical numbers.
 class ClosedLotResponse(BaseModel):
     symbol: str
-    quantity: Decimal
-    cost_basis_usd: Decimal
-    proceeds_usd: Decimal
-    gain_usd: Decimal
+    quantity: float
+    cost_basis_usd: float
+    proceeds_usd: float
+    gain_usd: float
     holding_days: int
     buy_date: datetime
     sell_date: datetime
@@ -26,17 +38,17 @@ class ClosedLotResponse(BaseModel):
 
 class OpenLotResponse(BaseModel):
     symbol: str
-    remaining_quantity: Decimal
-    cost_basis_per_unit_usd: Decimal
+    remaining_quantity: float
+    cost_basis_per_unit_usd: float
     buy_date: datetime
 
 
 class TaxableTransferResponse(BaseModel):
     timestamp: datetime
     symbol: str
-    quantity: Decimal
-    value_vnd: Decimal
-    tax_amount_vnd: Decimal
+    quantity: float
+    value_vnd: float
+    tax_amount_vnd: float
     exemption_reason: str | None = None
 
 
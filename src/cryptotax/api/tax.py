@@ -2,14 +2,16 @@
 
 import uuid
 from datetime import datetime
+from decimal import Decimal
 from typing import Annotated, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy import select
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from cryptotax.accounting.tax_engine import TaxEngine
-from cryptotax.api.deps import get_db
+from cryptotax.api.deps import get_db, get_response_cache
+from cryptotax.api.schemas.analytics import _to_float
 from cryptotax.api.schemas.tax import (
     ClosedLotResponse,
     OpenLotResponse,
@@ -20,14 +22,17 @@ from cryptotax.api.schemas.tax import (
 )
 from cryptotax.db.models.capital_gains import ClosedLotRecord, OpenLotRecord
 from cryptotax.db.repos.entity_repo import EntityRepo
+from cryptotax.infra.cache.namespaces import ANALYTICS_CACHE_NAMESPACE
+from cryptotax.infra.cache.response_cache import ResponseCache
 
 router = APIRouter(prefix="/api/tax", tags=["tax"])
 
 DbDep = Annotated[AsyncSession, Depends(get_db)]
+CacheDep = Annotated[ResponseCache | None, Depends(get_response_cache)]
 
 
 @router.post("/calculate", response_model=TaxCalculateResponse)
-async def calculate_tax(body: TaxCalculateRequest, db: DbDep) -> TaxCalculateResponse:
+async def calculate_tax(body: TaxCalculateRequest, db: DbDep, cache: CacheDep) -> Response:
     """Run FIFO capital gains calculation + Vietnam 0.1% transfer tax."""
     entity_repo = EntityRepo(db)
 
@@ -39,18 +44,16 @@ async def calculate_tax(body: TaxCalculateRequest, db: DbDep) -> TaxCalculateRes
     if entity is None:
         raise HTTPException(status_code=404, detail="Entity not found")
 
-    try:
-        start = datetime.fromisoformat(body.start_date).replace(tzinfo=None)
-        end = datetime.fromisoformat(body.end_date).replace(hour=23, minute=59, second=59, tzinfo=None)
-    except ValueError as e:
-        raise HTTPException(status_code=400, detail=f"Invalid date format: {e}")
-
     engine = TaxEngine(db)
-    result = await engine.calculate(entity.id, start, end)
+    result = await engine.calculate(entity.id, body.start_date, body.end_date)
     await db.commit()
+    if cache is not None:
+        await cache.invalidate(ANALYTICS_CACHE_NAMESPACE)
 
-    return TaxCalculateResponse(
-        summary=TaxSummaryResponse(
+    # The engine already produced typed values — build responses without re-validating each lot,
+    # and serialize directly so FastAPI doesn't re-validate the whole payload against response_model
+    response = TaxCalculateResponse.model_construct(
+        summary=TaxSummaryResponse.model_construct(
             period_start=result.period_start,
             period_end=result.period_end,
             total_realized_gain_usd=result.total_realized_gain_usd,
@@ -61,12 +64,12 @@ async def calculate_tax(body: TaxCalculateRequest, db: DbDep) -> TaxCalculateRes
             taxable_transfer_count=len(result.taxable_transfers),
         ),
         closed_lots=[
-            ClosedLotResponse(
+            ClosedLotResponse.model_construct(
                 symbol=cl.symbol,
-                quantity=cl.quantity,
-                cost_basis_usd=cl.cost_basis_usd,
-                proceeds_usd=cl.proceeds_usd,
-                gain_usd=cl.gain_usd,
+                quantity=_to_float(cl.quantity),
+                cost_basis_usd=_to_float(cl.cost_basis_usd),
+                proceeds_usd=_to_float(cl.proceeds_usd),
+                gain_usd=_to_float(cl.gain_usd),
                 holding_days=cl.holding_days,
                 buy_date=cl.buy_trade.timestamp,
                 sell_date=cl.sell_trade.timestamp,
@@ -74,26 +77,27 @@ async def calculate_tax(body: TaxCalculateRequest, db: DbDep) -> TaxCalculateRes
             for cl in result.closed_lots
         ],
         open_lots=[
-            OpenLotResponse(
+            OpenLotResponse.model_construct(
                 symbol=ol.symbol,
-                remaining_quantity=ol.remaining_quantity,
-                cost_basis_per_unit_usd=ol.cost_basis_per_unit_usd,
+                remaining_quantity=_to_float(ol.remaining_quantity),
+                cost_basis_per_unit_usd=_to_float(ol.cost_basis_per_unit_usd),
                 buy_date=ol.buy_trade.timestamp,
             )
             for ol in result.open_lots
         ],
         taxable_transfers=[
-            TaxableTransferResponse(
+            TaxableTransferResponse.model_construct(
                 timestamp=tt.timestamp,
                 symbol=tt.symbol,
-                quantity=tt.quantity,
-                value_vnd=tt.value_vnd,
-                tax_amount_vnd=tt.tax_amount_vnd,
+                quantity=_to_float(tt.quantity),
+                value_vnd=_to_float(tt.value_vnd),
+                tax_amount_vnd=_to_float(tt.tax_amount_vnd),
                 exemption_reason=tt.exemption_reason.value if tt.exemption_reason else None,
             )
             for tt in result.taxable_transfers
         ],
     )
+    return Response(content=response.model_dump_json(), media_type="application/json")
 
 
 @router.get("/realized-gains", response_model=list[ClosedLotResponse])
@@ -109,7 +113,18 @@ async def get_realized_gains(
     max_holding_days: Optional[int] = Query(None, ge=0),
 ) -> list[ClosedLotResponse]:
     """List all realized gains (closed lots), optionally scoped by entity."""
-    stmt = select(ClosedLotRecord).order_by(ClosedLotRecord.sell_timestamp.desc())
+    # Plain column rows — no ORM hydration for what is a read-only listing
+    stmt = select(
+        ClosedLotRecord.symbol,
+        ClosedLotRecord.quantity,
+        ClosedLotRecord.cost_basis_usd,
+        ClosedLotRecord.proceeds_usd,
+        ClosedLotRecord.gain_usd,
+        ClosedLotRecord.holding_days,
+        ClosedLotRecord.buy_timestamp,
+        ClosedLotRecord.sell_timestamp,
+        ClosedLotRecord.created_at,
+    ).order_by(ClosedLotRecord.sell_timestamp.desc())
     if entity_id is not None:
         stmt = stmt.where(ClosedLotRecord.entity_id == entity_id)
     if symbol is not None:
@@ -127,19 +142,18 @@ async def get_realized_gains(
     if max_holding_days is not None:
         stmt = stmt.where(ClosedLotRecord.holding_days <= max_holding_days)
     result = await db.execute(stmt)
-    records = result.scalars().all()
     return [
-        ClosedLotResponse(
+        ClosedLotResponse.model_construct(
             symbol=r.symbol,
-            quantity=r.quantity,
-            cost_basis_usd=r.cost_basis_usd,
-            proceeds_usd=r.proceeds_usd,
-            gain_usd=r.gain_usd,
+            quantity=_to_float(r.quantity),
+            cost_basis_usd=_to_float(r.cost_basis_usd),
+            proceeds_usd=_to_float(r.proceeds_usd),
+            gain_usd=_to_float(r.gain_usd),
             holding_days=r.holding_days,
             buy_date=r.buy_timestamp or r.created_at,
             sell_date=r.sell_timestamp or r.created_at,
         )
-        for r in records
+        for r in result.all()
     ]
 
 
@@ -151,7 +165,13 @@ async def get_open_lots(
     min_quantity: Optional[float] = Query(None, ge=0, description="Minimum remaining quantity"),
 ) -> list[OpenLotResponse]:
     """List all open (unrealized) positions, optionally scoped by entity."""
-    stmt = select(OpenLotRecord).order_by(OpenLotRecord.buy_timestamp.asc())
+    stmt = select(
+        OpenLotRecord.symbol,
+        OpenLotRecord.remaining_quantity,
+        OpenLotRecord.cost_basis_per_unit_usd,
+        OpenLotRecord.buy_timestamp,
+        OpenLotRecord.created_at,
+    ).order_by(OpenLotRecord.buy_timestamp.asc())
     if entity_id is not None:
         stmt = stmt.where(OpenLotRecord.entity_id == entity_id)
     if symbol is not None:
@@ -159,15 +179,14 @@ async def get_open_lots(
     if min_quantity is not None:
         stmt = stmt.where(OpenLotRecord.remaining_quantity >= min_quantity)
     result = await db.execute(stmt)
-    records = result.scalars().all()
     return [
-        OpenLotResponse(
+        OpenLotResponse.model_construct(
             symbol=r.symbol,
-            remaining_quantity=r.remaining_quantity,
-            cost_basis_per_unit_usd=r.cost_basis_per_unit_usd,
+            remaining_quantity=_to_float(r.remaining_quantity),
+            cost_basis_per_unit_usd=_to_float(r.cost_basis_per_unit_usd),
             buy_date=r.buy_timestamp or r.created_at,
         )
-        for r in records
+        for r in result.all()
     ]
 
 
@@ -177,32 +196,31 @@ async def get_tax_summary(
     entity_id: Optional[uuid.UUID] = Query(None, description="Entity ID to scope summary"),
 ):
     """Get latest tax summary from persisted data, optionally scoped by entity."""
-    # Aggregate from closed/open lot records
-    closed_stmt = select(ClosedLotRecord)
-    open_stmt = select(OpenLotRecord)
+    # Aggregate in SQL — one row of scalars instead of every lot record
+    open_count = select(func.count()).select_from(OpenLotRecord)
+    stmt = select(
+        func.coalesce(func.sum(ClosedLotRecord.gain_usd), 0),
+        func.min(ClosedLotRecord.buy_timestamp),
+        func.max(ClosedLotRecord.sell_timestamp),
+        func.count(ClosedLotRecord.id),
+    )
     if entity_id is not None:
-        closed_stmt = closed_stmt.where(ClosedLotRecord.entity_id == entity_id)
-        open_stmt = open_stmt.where(OpenLotRecord.entity_id == entity_id)
-
-    closed_result = await db.execute(closed_stmt)
-    closed = closed_result.scalars().all()
+        stmt = stmt.where(ClosedLotRecord.entity_id == entity_id)
+        open_count = open_count.where(OpenLotRecord.entity_id == entity_id)
+    stmt = stmt.add_columns(open_count.scalar_subquery())
 
-    open_result = await db.execute(open_stmt)
-    open_lots = open_result.scalars().all()
+    total_gain, first_buy, last_sell, closed_count, open_lot_count = (await db.execute(stmt)).one()
 
-    if not closed and not open_lots:
+    if not closed_count and not open_lot_count:
         return None
 
-    from decimal import Decimal
-    total_gain = sum((r.gain_usd for r in closed), Decimal(0))
-
     return TaxSummaryResponse(
-        period_start=min((r.buy_timestamp for r in closed if r.buy_timestamp), default=datetime.now()),
-        period_end=max((r.sell_timestamp for r in closed if r.sell_timestamp), default=datetime.now()),
-        total_realized_gain_usd=total_gain,
+        period_start=first_buy or datetime.now(),
+        period_end=last_sell or datetime.now(),
+        total_realized_gain_usd=Decimal(total_gain),
         total_transfer_tax_vnd=Decimal(0),  # Only available from full calculate
         total_exempt_vnd=Decimal(0),
-        closed_lot_count=len(closed),
-        open_lot_count=len(open_lots),
+        closed_lot_count=closed_count,
+        open_lot_count=open_lot_count,
         taxable_transfer_count=0,
     )
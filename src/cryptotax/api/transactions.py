@@ -3,6 +3,7 @@ from datetime import datetime
 from typing import Annotated, Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
+from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from cryptotax.api.deps import get_db, resolve_entity
@@ -14,6 +15,8 @@ router = APIRouter(prefix="/api/transactions", tags=["transactions"])
 
 DbDep = Annotated[AsyncSession, Depends(get_db)]
 
+_TX_LIST_ADAPTER = TypeAdapter(list[TransactionResponse])
+
 
 @router.get("", response_model=TransactionList)
 async def list_transactions(
@@ -37,7 +40,7 @@ async def list_transactions(
         )
 
     return TransactionList(
-        transactions=[TransactionResponse.model_validate(tx) for tx in txs],
+        transactions=_TX_LIST_ADAPTER.validate_python(txs, from_attributes=True),
         total=total,
         limit=limit,
         offset=offset,
@@ -1,17 +1,24 @@
+import asyncio
+import io
 import uuid
 from typing import Annotated
 
 from fastapi import APIRouter, Depends, HTTPException, UploadFile, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from cryptotax.api.deps import get_db, resolve_entity
+from cryptotax.api.deps import get_db, get_response_cache, resolve_entity
 from cryptotax.api.schemas.wallets import CEXWalletCreate, WalletCreate, WalletList, WalletResponse, WalletStatusResponse
+from cryptotax.config import settings
 from cryptotax.db.models.entity import Entity
 from cryptotax.db.repos.wallet_repo import WalletRepo
+from cryptotax.infra.cache.namespaces import ANALYTICS_CACHE_NAMESPACE, STATS_CACHE_NAMESPACE
+from cryptotax.infra.cache.response_cache import ResponseCache
+from cryptotax.infra.cex.crypto import encrypt_value
 
 router = APIRouter(prefix="/api/wallets", tags=["wallets"])
 
 DbDep = Annotated[AsyncSession, Depends(get_db)]
+CacheDep = Annotated[ResponseCache | None, Depends(get_response_cache)]
 
 
 @router.post("", response_model=WalletResponse, status_code=status.HTTP_201_CREATED)
@@ -24,16 +31,12 @@ async def add_wallet(body: WalletCreate, db: DbDep, entity: Entity = Depends(res
 
     wallet = await wallet_repo.create(entity_id=entity.id, chain=body.chain, address=body.address, label=body.label)
     await db.commit()
-    await db.refresh(wallet)
     return WalletResponse.model_validate(wallet)
 
 
 @router.post("/cex", response_model=WalletResponse, status_code=status.HTTP_201_CREATED)
 async def add_cex_wallet(body: CEXWalletCreate, db: DbDep, entity: Entity = Depends(resolve_entity)) -> WalletResponse:
     """Add a CEX wallet (e.g. Binance) with encrypted API credentials."""
-    from cryptotax.config import settings
-    from cryptotax.infra.cex.crypto import encrypt_value
-
     wallet_repo = WalletRepo(db)
 
     existing = await wallet_repo.get_by_exchange(entity.id, body.exchange)
@@ -51,7 +54,6 @@ async def add_cex_wallet(body: CEXWalletCreate, db: DbDep, entity: Entity = Depe
         label=body.label,
     )
     await db.commit()
-    await db.refresh(wallet)
     return WalletResponse.model_validate(wallet)
 
 
@@ -64,13 +66,15 @@ async def list_wallets(db: DbDep, entity: Entity = Depends(resolve_entity)) -> W
 
 
 @router.delete("/{wallet_id}", status_code=status.HTTP_204_NO_CONTENT)
-async def remove_wallet(wallet_id: uuid.UUID, db: DbDep) -> None:
+async def remove_wallet(wallet_id: uuid.UUID, db: DbDep, cache: CacheDep) -> None:
     wallet_repo = WalletRepo(db)
     wallet = await wallet_repo.get_by_id(wallet_id)
     if wallet is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Wallet not found")
     await wallet_repo.delete(wallet)
     await db.commit()
+    if cache is not None:
+        await cache.invalidate(ANALYTICS_CACHE_NAMESPACE)
 
 
 @router.post("/{wallet_id}/sync", response_model=WalletResponse)
@@ -88,15 +92,15 @@ async def trigger_sync(wallet_id: uuid.UUID, db: DbDep) -> WalletResponse:
 
     wallet.sync_status = "SYNCING"
     await db.commit()
-    await db.refresh(wallet)
 
-    sync_wallet_task.delay(str(wallet_id))
+    # delay() is a blocking broker publish; keep it off the event loop
+    await asyncio.to_thread(sync_wallet_task.delay, str(wallet_id))
 
     return WalletResponse.model_validate(wallet)
 
 
 @router.post("/{wallet_id}/import-csv", response_model=dict)
-async def import_csv(wallet_id: uuid.UUID, file: UploadFile, db: DbDep) -> dict:
+async def import_csv(wallet_id: uuid.UUID, file: UploadFile, db: DbDep, cache: CacheDep) -> dict:
     """Upload a Binance CSV file to import trades."""
     from cryptotax.db.models.wallet import CEXWallet
     from cryptotax.infra.cex.csv_import import BinanceCSVImporter
@@ -108,10 +112,18 @@ async def import_csv(wallet_id: uuid.UUID, file: UploadFile, db: DbDep) -> dict:
     if not isinstance(wallet, CEXWallet):
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="CSV import only for CEX wallets")
 
-    content = (await file.read()).decode("utf-8")
-    importer = BinanceCSVImporter(db)
-    count = await importer.import_trades(wallet, content)
+    # Decode the spooled upload incrementally instead of reading it into one bytes + str copy
+    await file.seek(0)
+    text = io.TextIOWrapper(file.file, encoding="utf-8", newline="")
+    try:
+        importer = BinanceCSVImporter(db)
+        count = await importer.import_trades(wallet, text)
+    finally:
+        text.detach()  # leave closing the upload to Starlette
     await db.commit()
+    if cache is not None:
+        # New LOADED transactions change the parse stats counts
+        await cache.invalidate(STATS_CACHE_NAMESPACE)
     return {"imported": count}
 
 
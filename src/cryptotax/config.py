@@ -1,3 +1,5 @@
+from functools import cached_property, lru_cache
+
 from pydantic_settings import BaseSettings
 
 
@@ -7,6 +9,13 @@ class Settings(BaseSettings):
     db_user: str = "postgres"
     db_password: str = "postgres"
     db_name: str = "leafjots"
+    db_pool_size: int = 20
+    db_max_overflow: int = 40
+    db_pool_timeout: float = 30.0
+    db_pool_recycle: int = 3600  # seconds; recycle before server-side idle timeouts
+    db_pool_pre_ping: bool = True
+    db_statement_cache_size: int = 512  # asyncpg prepared statements kept per connection
+    db_query_cache_size: int = 1200  # compiled SQL kept by SQLAlchemy (one per statement shape)
     redis_url: str = "redis://localhost:6379/0"
     alchemy_api_key: str = ""
     etherscan_api_key: str = ""
@@ -21,7 +30,7 @@ class Settings(BaseSettings):
     debug: bool = True
     usd_vnd_rate: int = 25000  # Default USD/VND exchange rate
 
-    @property
+    @cached_property
     def database_url(self) -> str:
         return f"postgresql+asyncpg://{self.db_user}:{self.db_password}@{self.db_host}:{self.db_port}/{self.db_name}"
 
@@ -29,4 +38,10 @@ class Settings(BaseSettings):
         env_file = ".env"
 
 
-settings = Settings()
+@lru_cache
+def get_settings() -> Settings:
+    """The process-wide Settings — .env is read once, shared by module imports and the container."""
+    return Settings()
+
+
+settings = get_settings()
@@ -1,21 +1,48 @@
 from dependency_injector import containers, providers
+from redis.asyncio import Redis
 
-from cryptotax.config import Settings
+from cryptotax.config import get_settings
 from cryptotax.db.session import build_engine, build_session_factory
+from cryptotax.infra.cache.response_cache import ResponseCache
+from cryptotax.infra.cache.ttl_cache import TTLCache
 
 
 class Container(containers.DeclarativeContainer):
-    wiring_config = containers.WiringConfiguration(modules=["cryptotax.api.deps"])
-
-    settings = providers.Singleton(Settings)
+    settings = providers.Singleton(get_settings)
 
     engine = providers.Singleton(
         build_engine,
         database_url=settings.provided.database_url,
         echo=settings.provided.debug,
+        pool_size=settings.provided.db_pool_size,
+        max_overflow=settings.provided.db_max_overflow,
+        pool_timeout=settings.provided.db_pool_timeout,
+        pool_recycle=settings.provided.db_pool_recycle,
+        pool_pre_ping=settings.provided.db_pool_pre_ping,
+        statement_cache_size=settings.provided.db_statement_cache_size,
+        query_cache_size=settings.provided.db_query_cache_size,
     )
 
     session_factory = providers.Singleton(
         build_session_factory,
         engine=engine,
     )
+
+    redis_client = providers.Singleton(
+        Redis.from_url,
+        settings.provided.redis_url,
+        socket_connect_timeout=0.5,
+        socket_timeout=0.5,
+    )
+
+    response_cache = providers.Singleton(
+        ResponseCache,
+        client=redis_client,
+    )
+
+    # Resolved entity ids keyed by requested id (or "default"); cleared on entity create/delete
+    entity_cache = providers.Singleton(
+        TTLCache,
+        maxsize=128,
+        ttl=60,
+    )
@@ -1,7 +1,7 @@
 import uuid
 from typing import Optional
 
-from sqlalchemy import ForeignKey, String
+from sqlalchemy import ForeignKey, Index, String
 from sqlalchemy.orm import Mapped, mapped_column
 
 from cryptotax.db.session import Base, TimestampMixin, UUIDPrimaryKey
@@ -11,6 +11,7 @@ class Account(UUIDPrimaryKey, TimestampMixin, Base):
     """Account using single-table inheritance (8 subtypes)."""
 
     __tablename__ = "accounts"
+    __table_args__ = (Index("ix_accounts_wallet_subtype", "wallet_id", "subtype"),)
 
     wallet_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("wallets.id"))
     account_type: Mapped[str] = mapped_column(String(20))
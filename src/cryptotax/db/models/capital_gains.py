@@ -5,7 +5,7 @@ from datetime import datetime
 from decimal import Decimal
 from typing import Optional
 
-from sqlalchemy import BigInteger, ForeignKey, Numeric, String
+from sqlalchemy import BigInteger, ForeignKey, Index, Numeric, String, text
 from sqlalchemy.orm import Mapped, mapped_column
 
 from cryptotax.db.session import Base, TimestampMixin, UUIDPrimaryKey
@@ -15,6 +15,13 @@ class ClosedLotRecord(UUIDPrimaryKey, TimestampMixin, Base):
     """Persisted FIFO-matched realized gain/loss."""
 
     __tablename__ = "closed_lots"
+    __table_args__ = (
+        # /api/tax/realized-gains: filter by entity (+symbol), newest sells first
+        Index("ix_closed_lots_entity_sell", "entity_id", text("sell_timestamp DESC"), "symbol"),
+        # gain_only / loss_only filters
+        Index("ix_closed_lots_gain_positive", "entity_id", "sell_timestamp", postgresql_where=text("gain_usd > 0")),
+        Index("ix_closed_lots_gain_negative", "entity_id", "sell_timestamp", postgresql_where=text("gain_usd < 0")),
+    )
 
     entity_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("entities.id"))
     symbol: Mapped[str] = mapped_column(String(50))
@@ -33,6 +40,7 @@ class OpenLotRecord(UUIDPrimaryKey, TimestampMixin, Base):
     """Persisted open (unrealized) position from FIFO calculation."""
 
     __tablename__ = "open_lots"
+    __table_args__ = (Index("ix_open_lots_entity_buy", "entity_id", "buy_timestamp", "symbol"),)
 
     entity_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("entities.id"))
     symbol: Mapped[str] = mapped_column(String(50))
@@ -3,7 +3,7 @@ from datetime import datetime
 from decimal import Decimal
 from typing import Optional
 
-from sqlalchemy import BigInteger, ForeignKey, Numeric, String, Text
+from sqlalchemy import BigInteger, ForeignKey, Index, Numeric, String, Text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from cryptotax.db.session import Base, TimestampMixin, UUIDPrimaryKey
@@ -14,6 +14,10 @@ class JournalEntry(UUIDPrimaryKey, TimestampMixin, Base):
     """A journal entry grouping balanced splits. Sum of all splits must equal zero."""
 
     __tablename__ = "journal_entries"
+    # Analytics filter by entity and time range; entry_type/transaction_id ride along for index-only scans
+    __table_args__ = (
+        Index("ix_je_entity_time", "entity_id", "timestamp", postgresql_include=["entry_type", "transaction_id"]),
+    )
 
     entity_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("entities.id"))
     transaction_id: Mapped[Optional[int]] = mapped_column(BigInteger, ForeignKey("transactions.id"), default=None)
@@ -35,6 +39,12 @@ class JournalSplit(UUIDPrimaryKey, TimestampMixin, Base):
     """One leg of a journal entry. Positive=increase, Negative=decrease."""
 
     __tablename__ = "journal_splits"
+    # Per-account balance sums read quantity/value_usd/value_vnd straight from the index
+    __table_args__ = (
+        Index("ix_js_acct_covering", "account_id", postgresql_include=["quantity", "value_usd", "value_vnd"]),
+        # Entry → splits joins and the selectin load of JournalEntry.splits
+        Index("ix_js_entry", "journal_entry_id"),
+    )
 
     journal_entry_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("journal_entries.id"))
     account_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("accounts.id"))
@@ -26,8 +26,5 @@ class TaxableTransferRecord(UUIDPrimaryKey, TimestampMixin, Base):
     exemption_reason: Mapped[Optional[str]] = mapped_column(String(50), default=None)
     timestamp: Mapped[datetime]
 
-    __table_args__ = (
-        Index("ix_taxable_transfers_entity_id", "entity_id"),
-        Index("ix_taxable_transfers_timestamp", "timestamp"),
-        Index("ix_taxable_transfers_symbol", "symbol"),
-    )
+    # Every query is scoped to one entity, usually over a period; symbol only narrows within that
+    __table_args__ = (Index("ix_tt_entity_time", "entity_id", "timestamp"),)
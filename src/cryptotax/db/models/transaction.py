@@ -16,6 +16,7 @@ class Transaction(TimestampMixin, Base):
     __table_args__ = (
         UniqueConstraint("wallet_id", "tx_hash", name="uq_wallet_tx_hash"),
         Index("ix_chain_block_number", "chain", "block_number"),
+        Index("ix_tx_wallet_status", "wallet_id", "status"),
     )
 
     id: Mapped[int] = mapped_column(BigInteger().with_variant(sa.Integer, "sqlite"), primary_key=True, autoincrement=True)
@@ -1,28 +1,49 @@
 import uuid
+from collections.abc import AsyncIterator
 from decimal import Decimal
 from typing import Optional
 
-from sqlalchemy import func, select
+from sqlalchemy import Select, bindparam, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from cryptotax.db.models.account import Account
 from cryptotax.db.models.journal import JournalSplit
 from cryptotax.db.models.wallet import Wallet
 
+# Rows fetched per chunk when streaming accounts or per-account balances
+STREAM_YIELD_PER = 1000
+
+# Fixed single-row lookups, built once instead of on every call
+_GET_BY_ID = select(Account).where(Account.id == bindparam("account_id"))
+_GET_BY_LABEL = select(Account).where(Account.label == bindparam("label"))
+_GET_BALANCE = select(func.coalesce(func.sum(JournalSplit.quantity), 0)).where(
+    JournalSplit.account_id == bindparam("account_id")
+)
+
+
+def _balance_totals() -> Select:
+    """Per-account quantity / USD / VND sums over journal splits (caller adds the filter)."""
+    return select(
+        JournalSplit.account_id,
+        func.sum(JournalSplit.quantity),
+        func.coalesce(func.sum(JournalSplit.value_usd), 0),
+        func.coalesce(func.sum(JournalSplit.value_vnd), 0),
+    ).group_by(JournalSplit.account_id)
+
 
 class AccountRepo:
     def __init__(self, session: AsyncSession) -> None:
         self._session = session
 
-    async def get_all_for_entity(
-        self,
+    @staticmethod
+    def _entity_accounts(
         entity_id: uuid.UUID,
         account_type: Optional[str] = None,
         subtype: Optional[str] = None,
         symbol: Optional[str] = None,
         protocol: Optional[str] = None,
         wallet_id: Optional[uuid.UUID] = None,
-    ) -> list[Account]:
+    ) -> Select:
         base = (
             select(Account)
             .join(Wallet, Account.wallet_id == Wallet.id)
@@ -38,38 +59,78 @@ class AccountRepo:
             base = base.where(Account.protocol == protocol)
         if wallet_id is not None:
             base = base.where(Account.wallet_id == wallet_id)
-        result = await self._session.execute(base.order_by(Account.account_type, Account.label))
-        return list(result.scalars().all())
+        return base.order_by(Account.account_type, Account.label)
 
-    async def get_by_id(self, account_id: uuid.UUID) -> Optional[Account]:
+    async def get_all_for_entity(
+        self,
+        entity_id: uuid.UUID,
+        account_type: Optional[str] = None,
+        subtype: Optional[str] = None,
+        symbol: Optional[str] = None,
+        protocol: Optional[str] = None,
+        wallet_id: Optional[uuid.UUID] = None,
+    ) -> list[Account]:
         result = await self._session.execute(
-            select(Account).where(Account.id == account_id)
+            self._entity_accounts(entity_id, account_type, subtype, symbol, protocol, wallet_id)
+        )
+        return list(result.scalars().all())
+
+    async def stream_all_for_entity(
+        self,
+        entity_id: uuid.UUID,
+        account_type: Optional[str] = None,
+        subtype: Optional[str] = None,
+        symbol: Optional[str] = None,
+        protocol: Optional[str] = None,
+        wallet_id: Optional[uuid.UUID] = None,
+    ) -> AsyncIterator[Account]:
+        """Like get_all_for_entity, but fetches and builds accounts STREAM_YIELD_PER rows at a time."""
+        result = await self._session.stream_scalars(
+            self._entity_accounts(entity_id, account_type, subtype, symbol, protocol, wallet_id)
+            .execution_options(yield_per=STREAM_YIELD_PER)
         )
+        async for account in result:
+            yield account
+
+    async def get_by_id(self, account_id: uuid.UUID) -> Optional[Account]:
+        result = await self._session.execute(_GET_BY_ID, {"account_id": account_id})
         return result.scalar_one_or_none()
 
     async def get_by_label(self, label: str) -> Optional[Account]:
-        result = await self._session.execute(
-            select(Account).where(Account.label == label)
-        )
+        result = await self._session.execute(_GET_BY_LABEL, {"label": label})
         return result.scalar_one_or_none()
 
     async def get_balance(self, account_id: uuid.UUID) -> Decimal:
-        result = await self._session.execute(
-            select(func.coalesce(func.sum(JournalSplit.quantity), 0))
-            .where(JournalSplit.account_id == account_id)
-        )
+        result = await self._session.execute(_GET_BALANCE, {"account_id": account_id})
         return result.scalar_one()
 
-    async def get_balances_for_entity(self, entity_id: uuid.UUID) -> dict[uuid.UUID, Decimal]:
-        """Get current balance for all accounts of an entity."""
-        result = await self._session.execute(
-            select(JournalSplit.account_id, func.sum(JournalSplit.quantity))
+    async def get_balances(self, account_ids: list[uuid.UUID]) -> dict[uuid.UUID, tuple[Decimal, Decimal, Decimal]]:
+        """Get (quantity, value_usd, value_vnd) balances for many accounts in one query."""
+        if not account_ids:
+            return {}
+        return await self._fold_balance_totals(_balance_totals().where(JournalSplit.account_id.in_(account_ids)))
+
+    async def get_balance_totals_for_entity(
+        self, entity_id: uuid.UUID
+    ) -> dict[uuid.UUID, tuple[Decimal, Decimal, Decimal]]:
+        """Get (quantity, value_usd, value_vnd) balances for all accounts of an entity."""
+        return await self._fold_balance_totals(
+            _balance_totals()
             .join(Account, JournalSplit.account_id == Account.id)
             .join(Wallet, Account.wallet_id == Wallet.id)
             .where(Wallet.entity_id == entity_id)
-            .group_by(JournalSplit.account_id)
         )
-        return {row[0]: row[1] for row in result.all()}
+
+    async def _fold_balance_totals(self, stmt: Select) -> dict[uuid.UUID, tuple[Decimal, Decimal, Decimal]]:
+        """Stream balance rows into the result dict as they arrive rather than buffering them all first."""
+        result = await self._session.stream(stmt.execution_options(yield_per=STREAM_YIELD_PER))
+        # row[1:] is a C-level slice to a plain (qty, usd, vnd) tuple
+        return {row[0]: row[1:] async for row in result}
+
+    async def get_balances_for_entity(self, entity_id: uuid.UUID) -> dict[uuid.UUID, Decimal]:
+        """Get current balance for all accounts of an entity."""
+        totals = await self.get_balance_totals_for_entity(entity_id)
+        return {account_id: qty for account_id, (qty, _, _) in totals.items()}
 
     async def get_balances_usd_vnd_for_entity(
         self, entity_id: uuid.UUID
@@ -78,15 +139,5 @@ class AccountRepo:
 
         Returns a dict mapping account_id -> (balance_usd, balance_vnd).
         """
-        result = await self._session.execute(
-            select(
-                JournalSplit.account_id,
-                func.coalesce(func.sum(JournalSplit.value_usd), 0),
-                func.coalesce(func.sum(JournalSplit.value_vnd), 0),
-            )
-            .join(Account, JournalSplit.account_id == Account.id)
-            .join(Wallet, Account.wallet_id == Wallet.id)
-            .where(Wallet.entity_id == entity_id)
-            .group_by(JournalSplit.account_id)
-        )
-        return {row[0]: (row[1], row[2]) for row in result.all()}
+        totals = await self.get_balance_totals_for_entity(entity_id)
+        return {account_id: (usd, vnd) for account_id, (_, usd, vnd) in totals.items()}
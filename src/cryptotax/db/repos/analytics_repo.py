@@ -1,79 +1,80 @@
 """AnalyticsRepo — comprehensive analytics queries on journal/account data."""
 
-import uuid
+import asyncio
+from collections.abc import Awaitable, Callable
 from datetime import datetime, timedelta
 from decimal import Decimal
 from typing import Any, Optional
 
-from sqlalchemy import case, distinct, func, select
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import ColumnElement, Row, Select, case, distinct, func, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from cryptotax.db.models.account import Account
 from cryptotax.db.models.journal import JournalEntry, JournalSplit
 from cryptotax.db.models.wallet import OnChainWallet, Wallet
 
+# Rows fetched per chunk when streaming unbounded series (per period, per symbol, ...)
+STREAM_YIELD_PER = 1000
+
+_KNOWN_FILTERS = frozenset({
+    "entity_id", "date_from", "date_to", "wallet_id", "chain",
+    "symbol", "entry_type", "account_type", "protocol", "account_subtype",
+})
+
+# WHERE criterion builders per filter key (entity_id is applied by each query itself)
+_FILTER_CRITERIA: dict[str, Callable[[Any], ColumnElement[bool]]] = {
+    "date_from": lambda v: JournalEntry.timestamp >= v,
+    "date_to": lambda v: JournalEntry.timestamp <= v,
+    "wallet_id": lambda v: Wallet.id == v,
+    "chain": lambda v: OnChainWallet.chain == v,
+    "symbol": lambda v: Account.symbol == v,
+    "entry_type": lambda v: JournalEntry.entry_type == v,
+    "account_type": lambda v: Account.account_type == v,
+    "protocol": lambda v: Account.protocol == v,
+    "account_subtype": lambda v: Account.subtype == v,
+}
+
+# Filters that read journal_entries columns; without them split-only queries skip that join
+_ENTRY_FILTERS = frozenset({"date_from", "date_to", "entry_type"})
+
 
 class AnalyticsRepo:
     """Repository for analytics queries across journal entries, splits, accounts, and wallets."""
 
-    def __init__(self, session: AsyncSession) -> None:
+    def __init__(
+        self,
+        session: AsyncSession,
+        session_factory: Optional[async_sessionmaker[AsyncSession]] = None,
+    ) -> None:
         self._session = session
+        # When given, independent read queries run concurrently, each on its own session
+        self._session_factory = session_factory
 
-    def _base_query(
-        self,
-        *,
-        entity_id: uuid.UUID,
-        date_from: Optional[datetime] = None,
-        date_to: Optional[datetime] = None,
-        wallet_id: Optional[uuid.UUID] = None,
-        chain: Optional[str] = None,
-        symbol: Optional[str] = None,
-        entry_type: Optional[str] = None,
-        account_type: Optional[str] = None,
-        protocol: Optional[str] = None,
-        account_subtype: Optional[str] = None,
-    ):
-        """Build base select with common joins and WHERE filters.
-
-        Returns a select() on (JournalEntry, JournalSplit, Account, Wallet)
-        with all common filters applied.
-        """
-        stmt = (
-            select(JournalEntry, JournalSplit, Account, Wallet)
-            .join(JournalSplit, JournalSplit.journal_entry_id == JournalEntry.id)
-            .join(Account, JournalSplit.account_id == Account.id)
-            .join(Wallet, Account.wallet_id == Wallet.id)
-            .where(Wallet.entity_id == entity_id)
-        )
+    async def _fetch_one_each(self, *stmts: Select) -> list[Row]:
+        """Run independent single-row queries, concurrently if a session factory is available."""
+        if self._session_factory is None:
+            return [(await self._session.execute(stmt)).one() for stmt in stmts]
 
-        if date_from is not None:
-            stmt = stmt.where(JournalEntry.timestamp >= date_from)
-        if date_to is not None:
-            stmt = stmt.where(JournalEntry.timestamp <= date_to)
-        if wallet_id is not None:
-            stmt = stmt.where(Wallet.id == wallet_id)
-        if chain is not None:
-            stmt = stmt.where(OnChainWallet.chain == chain)
-        if symbol is not None:
-            stmt = stmt.where(Account.symbol == symbol)
-        if entry_type is not None:
-            stmt = stmt.where(JournalEntry.entry_type == entry_type)
-        if account_type is not None:
-            stmt = stmt.where(Account.account_type == account_type)
-        if protocol is not None:
-            stmt = stmt.where(Account.protocol == protocol)
-        if account_subtype is not None:
-            stmt = stmt.where(Account.subtype == account_subtype)
-
-        return stmt
+        async def _run(stmt: Select) -> Row:
+            async with self._session_factory() as session:
+                return (await session.execute(stmt)).one()
+
+        return list(await asyncio.gather(*(_run(stmt) for stmt in stmts)))
+
+    async def _run_each(self, *calls: Callable[["AnalyticsRepo"], Awaitable[Any]]) -> list[Any]:
+        """Run independent repo calls, concurrently on separate sessions if a session factory is available."""
+        if self._session_factory is None:
+            return [await call(self) for call in calls]
+
+        async def _run(call: Callable[[AnalyticsRepo], Awaitable[Any]]) -> Any:
+            async with self._session_factory() as session:
+                return await call(AnalyticsRepo(session, session_factory=self._session_factory))
+
+        return list(await asyncio.gather(*(_run(call) for call in calls)))
 
     def _extract_filters(self, kwargs: dict[str, Any]) -> dict[str, Any]:
         """Extract known filter keys from kwargs."""
-        known = {
-            "entity_id", "date_from", "date_to", "wallet_id", "chain",
-            "symbol", "entry_type", "account_type", "protocol", "account_subtype",
-        }
-        return {k: v for k, v in kwargs.items() if k in known and v is not None}
+        return {k: v for k, v in kwargs.items() if k in _KNOWN_FILTERS and v is not None}
 
     # ── 1. Cash Flow Series ──────────────────────────────────────────
 
@@ -119,22 +120,22 @@ class AnalyticsRepo:
             stmt = self._apply_filter(stmt, key, val)
 
         stmt = stmt.group_by(period).order_by(period)
-        result = await self._session.execute(stmt)
+        result = await self._session.stream(stmt.execution_options(yield_per=STREAM_YIELD_PER))
 
         return [
             {
                 "period": row.period.isoformat() if row.period else None,
-                "inflow_usd": row.inflow_usd or Decimal(0),
-                "inflow_vnd": row.inflow_vnd or Decimal(0),
-                "outflow_usd": row.outflow_usd or Decimal(0),
-                "outflow_vnd": row.outflow_vnd or Decimal(0),
-                "net_usd": (row.inflow_usd or Decimal(0)) + (row.outflow_usd or Decimal(0)),
-                "net_vnd": (row.inflow_vnd or Decimal(0)) + (row.outflow_vnd or Decimal(0)),
-                "inflow_qty": row.inflow_qty or Decimal(0),
-                "outflow_qty": row.outflow_qty or Decimal(0),
-                "entry_count": row.entry_count or 0,
+                "inflow_usd": row.inflow_usd,
+                "inflow_vnd": row.inflow_vnd,
+                "outflow_usd": row.outflow_usd,
+                "outflow_vnd": row.outflow_vnd,
+                "net_usd": row.inflow_usd + row.outflow_usd,
+                "net_vnd": row.inflow_vnd + row.outflow_vnd,
+                "inflow_qty": row.inflow_qty,
+                "outflow_qty": row.outflow_qty,
+                "entry_count": row.entry_count,
             }
-            for row in result.all()
+            async for row in result
         ]
 
     # ── 2. KPI Summary ───────────────────────────────────────────────
@@ -170,42 +171,58 @@ class AnalyticsRepo:
         for key, val in f.items():
             money_stmt = self._apply_filter(money_stmt, key, val)
 
-        money_result = await self._session.execute(money_stmt)
-        money = money_result.one()
-
-        # Count aggregates (all account types)
-        count_stmt = (
+        # Count aggregates (all account types). The join is first collapsed to its distinct
+        # (entry, tx, symbol, protocol) combinations so the four DISTINCT counts hash a narrow,
+        # pre-deduplicated set rather than every split row.
+        combos = (
             select(
-                func.count(func.distinct(JournalEntry.id)).label("total_entries"),
-                func.count(func.distinct(JournalEntry.transaction_id)).label("total_txs"),
-                func.count(func.distinct(Account.symbol)).label("unique_tokens"),
-                func.count(func.distinct(Account.protocol)).label("unique_protocols"),
+                JournalEntry.id.label("entry_id"),
+                JournalEntry.transaction_id,
+                Account.symbol,
+                Account.protocol,
             )
             .select_from(JournalEntry)
             .join(JournalSplit, JournalSplit.journal_entry_id == JournalEntry.id)
             .join(Account, JournalSplit.account_id == Account.id)
             .join(Wallet, Account.wallet_id == Wallet.id)
             .where(Wallet.entity_id == entity_id)
+            .distinct()
         )
         for key, val in f.items():
-            count_stmt = self._apply_filter(count_stmt, key, val)
+            combos = self._apply_filter(combos, key, val)
+        combos = combos.subquery("combos")
+
+        count_stmt = select(
+            func.count(func.distinct(combos.c.entry_id)).label("total_entries"),
+            func.count(func.distinct(combos.c.transaction_id)).label("total_txs"),
+            func.count(func.distinct(combos.c.symbol)).label("unique_tokens"),
+            func.count(func.distinct(combos.c.protocol)).label("unique_protocols"),
+        )
 
-        count_result = await self._session.execute(count_stmt)
-        counts = count_result.one()
+        money, counts = await self._fetch_one_each(money_stmt, count_stmt)
 
         return {
-            "total_inflow_usd": money.total_inflow_usd or Decimal(0),
-            "total_inflow_vnd": money.total_inflow_vnd or Decimal(0),
-            "total_outflow_usd": money.total_outflow_usd or Decimal(0),
-            "total_outflow_vnd": money.total_outflow_vnd or Decimal(0),
-            "net_usd": (money.total_inflow_usd or Decimal(0)) + (money.total_outflow_usd or Decimal(0)),
-            "net_vnd": (money.total_inflow_vnd or Decimal(0)) + (money.total_outflow_vnd or Decimal(0)),
+            "total_inflow_usd": money.total_inflow_usd,
+            "total_inflow_vnd": money.total_inflow_vnd,
+            "total_outflow_usd": money.total_outflow_usd,
+            "total_outflow_vnd": money.total_outflow_vnd,
+            "net_usd": money.total_inflow_usd + money.total_outflow_usd,
+            "net_vnd": money.total_inflow_vnd + money.total_outflow_vnd,
             "total_entries": counts.total_entries,
             "total_txs": counts.total_txs,
             "unique_tokens": counts.unique_tokens,
             "unique_protocols": counts.unique_protocols,
         }
 
+    async def get_overview(self, **filters: Any) -> dict[str, Any]:
+        """KPI summary, monthly cash flow and composition snapshot for one dashboard request."""
+        kpi, cash_flow, composition = await self._run_each(
+            lambda repo: repo.get_kpi_summary(**filters),
+            lambda repo: repo.get_cash_flow_series(granularity="month", **filters),
+            lambda repo: repo.get_composition_snapshot(**filters),
+        )
+        return {"kpi": kpi, "cash_flow": cash_flow, "composition": composition}
+
     # ── 3. Top Symbols by Volume ─────────────────────────────────────
 
     async def get_top_symbols_by_volume(
@@ -215,46 +232,54 @@ class AnalyticsRepo:
         f = self._extract_filters(filters)
         entity_id = f.pop("entity_id")
 
-        volume_usd_col = func.sum(func.abs(func.coalesce(JournalSplit.value_usd, Decimal(0))))
-        total_qty_col = func.sum(func.abs(func.coalesce(JournalSplit.quantity, Decimal(0))))
-        entry_count_col = func.count(func.distinct(JournalEntry.id))
-
-        stmt = (
+        # Collapse splits to one row per (symbol, entry) first, so entries count with COUNT(*) instead of a DISTINCT
+        per_entry = (
             select(
                 Account.symbol,
-                volume_usd_col.label("volume_usd"),
-                func.coalesce(
-                    func.sum(case((JournalSplit.quantity > 0, JournalSplit.value_usd), else_=Decimal(0))), Decimal(0)
-                ).label("inflow_usd"),
-                func.coalesce(
-                    func.sum(case((JournalSplit.quantity < 0, JournalSplit.value_usd), else_=Decimal(0))), Decimal(0)
-                ).label("outflow_usd"),
-                entry_count_col.label("entry_count"),
-                total_qty_col.label("total_quantity"),
+                func.sum(func.abs(func.coalesce(JournalSplit.value_usd, Decimal(0)))).label("volume_usd"),
+                func.sum(case((JournalSplit.quantity > 0, JournalSplit.value_usd), else_=Decimal(0))).label("inflow_usd"),
+                func.sum(case((JournalSplit.quantity < 0, JournalSplit.value_usd), else_=Decimal(0))).label("outflow_usd"),
+                func.sum(func.abs(func.coalesce(JournalSplit.quantity, Decimal(0)))).label("total_quantity"),
             )
-            .select_from(JournalEntry)
-            .join(JournalSplit, JournalSplit.journal_entry_id == JournalEntry.id)
+            .select_from(JournalSplit)
             .join(Account, JournalSplit.account_id == Account.id)
             .join(Wallet, Account.wallet_id == Wallet.id)
             .where(Wallet.entity_id == entity_id)
             .where(Account.symbol.is_not(None))
         )
 
+        per_entry = self._join_entries_if_filtered(per_entry, f)
         for key, val in f.items():
-            stmt = self._apply_filter(stmt, key, val)
+            per_entry = self._apply_filter(per_entry, key, val)
+        per_entry = per_entry.group_by(Account.symbol, JournalSplit.journal_entry_id).subquery("per_entry")
+
+        volume_usd_col = func.sum(per_entry.c.volume_usd)
+        entry_count_col = func.count()
 
         # Sort by USD volume, fallback to entry count when all USD = 0
-        stmt = stmt.group_by(Account.symbol).order_by(volume_usd_col.desc(), entry_count_col.desc()).limit(limit)
+        stmt = (
+            select(
+                per_entry.c.symbol,
+                volume_usd_col.label("volume_usd"),
+                func.coalesce(func.sum(per_entry.c.inflow_usd), Decimal(0)).label("inflow_usd"),
+                func.coalesce(func.sum(per_entry.c.outflow_usd), Decimal(0)).label("outflow_usd"),
+                entry_count_col.label("entry_count"),
+                func.sum(per_entry.c.total_quantity).label("total_quantity"),
+            )
+            .group_by(per_entry.c.symbol)
+            .order_by(volume_usd_col.desc(), entry_count_col.desc())
+            .limit(limit)
+        )
         result = await self._session.execute(stmt)
 
         return [
             {
                 "symbol": row.symbol,
-                "volume_usd": row.volume_usd or Decimal(0),
-                "inflow_usd": row.inflow_usd or Decimal(0),
-                "outflow_usd": row.outflow_usd or Decimal(0),
+                "volume_usd": row.volume_usd,
+                "inflow_usd": row.inflow_usd,
+                "outflow_usd": row.outflow_usd,
                 "entry_count": row.entry_count,
-                "total_quantity": row.total_quantity or Decimal(0),
+                "total_quantity": row.total_quantity,
             }
             for row in result.all()
         ]
@@ -294,7 +319,7 @@ class AnalyticsRepo:
         return [
             {
                 "protocol": row.protocol_or_type,
-                "volume_usd": row.volume_usd or Decimal(0),
+                "volume_usd": row.volume_usd,
                 "entry_count": row.entry_count,
                 "entry_types": row.entry_types or [],
             }
@@ -319,12 +344,12 @@ class AnalyticsRepo:
                 func.coalesce(func.sum(JournalSplit.value_vnd), Decimal(0)).label("total_value_vnd"),
             )
             .select_from(JournalSplit)
-            .join(JournalEntry, JournalSplit.journal_entry_id == JournalEntry.id)
             .join(Account, JournalSplit.account_id == Account.id)
             .join(Wallet, Account.wallet_id == Wallet.id)
             .where(Wallet.entity_id == entity_id)
         )
 
+        stmt = self._join_entries_if_filtered(stmt, f)
         for key, val in f.items():
             stmt = self._apply_filter(stmt, key, val)
 
@@ -333,7 +358,7 @@ class AnalyticsRepo:
             .having(func.sum(JournalSplit.quantity) != 0)
             .order_by(Account.account_type, Account.subtype, Account.symbol)
         )
-        result = await self._session.execute(stmt)
+        result = await self._session.stream(stmt.execution_options(yield_per=STREAM_YIELD_PER))
 
         return [
             {
@@ -342,10 +367,10 @@ class AnalyticsRepo:
                 "symbol": row.symbol,
                 "protocol": row.protocol,
                 "total_quantity": row.total_quantity,
-                "total_value_usd": row.total_value_usd or Decimal(0),
-                "total_value_vnd": row.total_value_vnd or Decimal(0),
+                "total_value_usd": row.total_value_usd,
+                "total_value_vnd": row.total_value_vnd,
             }
-            for row in result.all()
+            async for row in result
         ]
 
     # ── 6. Activity Heatmap ──────────────────────────────────────────
@@ -357,7 +382,9 @@ class AnalyticsRepo:
         f = self._extract_filters(filters)
         entity_id = f.pop("entity_id")
 
-        cutoff = datetime.utcnow() - timedelta(days=days)
+        # Snap to midnight so every request within a day binds the same cutoff
+        today = datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0)
+        cutoff = today - timedelta(days=days)
         day_col = func.date_trunc("day", JournalEntry.timestamp).label("day")
 
         stmt = (
@@ -385,7 +412,7 @@ class AnalyticsRepo:
             {
                 "date": row.day.date().isoformat() if row.day else None,
                 "entry_count": row.entry_count,
-                "volume_usd": row.volume_usd or Decimal(0),
+                "volume_usd": row.volume_usd,
             }
             for row in result.all()
         ]
@@ -397,11 +424,11 @@ class AnalyticsRepo:
         f = self._extract_filters(filters)
         entity_id = f.pop("entity_id")
 
-        stmt = (
+        # One row per entry, so the outer query counts entries with COUNT(*)
+        per_entry = (
             select(
                 JournalEntry.entry_type,
-                func.count(func.distinct(JournalEntry.id)).label("entry_count"),
-                func.coalesce(func.sum(func.abs(func.coalesce(JournalSplit.value_usd, Decimal(0)))), Decimal(0)).label("volume_usd"),
+                func.sum(func.abs(func.coalesce(JournalSplit.value_usd, Decimal(0)))).label("volume_usd"),
             )
             .select_from(JournalEntry)
             .join(JournalSplit, JournalSplit.journal_entry_id == JournalEntry.id)
@@ -411,16 +438,25 @@ class AnalyticsRepo:
         )
 
         for key, val in f.items():
-            stmt = self._apply_filter(stmt, key, val)
+            per_entry = self._apply_filter(per_entry, key, val)
+        per_entry = per_entry.group_by(JournalEntry.id, JournalEntry.entry_type).subquery("per_entry")
 
-        stmt = stmt.group_by(JournalEntry.entry_type).order_by(func.count(func.distinct(JournalEntry.id)).desc())
+        stmt = (
+            select(
+                per_entry.c.entry_type,
+                func.count().label("entry_count"),
+                func.coalesce(func.sum(per_entry.c.volume_usd), Decimal(0)).label("volume_usd"),
+            )
+            .group_by(per_entry.c.entry_type)
+            .order_by(func.count().desc())
+        )
         result = await self._session.execute(stmt)
 
         return [
             {
                 "entry_type": row.entry_type,
                 "entry_count": row.entry_count,
-                "volume_usd": row.volume_usd or Decimal(0),
+                "volume_usd": row.volume_usd,
             }
             for row in result.all()
         ]
@@ -472,21 +508,21 @@ class AnalyticsRepo:
             stmt = self._apply_filter(stmt, key, val)
 
         stmt = stmt.group_by(period).order_by(period)
-        result = await self._session.execute(stmt)
+        result = await self._session.stream(stmt.execution_options(yield_per=STREAM_YIELD_PER))
 
         return [
             {
                 "period": row.period.isoformat() if row.period else None,
-                "income_usd": row.income_usd or Decimal(0),
-                "expense_usd": row.expense_usd or Decimal(0),
-                "income_vnd": row.income_vnd or Decimal(0),
-                "expense_vnd": row.expense_vnd or Decimal(0),
-                "income_count": row.income_count or 0,
-                "expense_count": row.expense_count or 0,
-                "net_usd": (row.income_usd or Decimal(0)) - (row.expense_usd or Decimal(0)),
-                "net_vnd": (row.income_vnd or Decimal(0)) - (row.expense_vnd or Decimal(0)),
+                "income_usd": row.income_usd,
+                "expense_usd": row.expense_usd,
+                "income_vnd": row.income_vnd,
+                "expense_vnd": row.expense_vnd,
+                "income_count": row.income_count,
+                "expense_count": row.expense_count,
+                "net_usd": row.income_usd - row.expense_usd,
+                "net_vnd": row.income_vnd - row.expense_vnd,
             }
-            for row in result.all()
+            async for row in result
         ]
 
     # ── 9. Balance Over Time ─────────────────────────────────────────
@@ -509,6 +545,10 @@ class AnalyticsRepo:
                 Account.symbol,
                 func.sum(JournalSplit.quantity).label("period_quantity"),
                 func.coalesce(func.sum(JournalSplit.value_usd), Decimal(0)).label("period_value_usd"),
+                # Running total per symbol, computed by the database over the grouped rows
+                func.sum(func.sum(JournalSplit.quantity))
+                .over(partition_by=Account.symbol, order_by=period)
+                .label("cumulative_quantity"),
             )
             .select_from(JournalEntry)
             .join(JournalSplit, JournalSplit.journal_entry_id == JournalEntry.id)
@@ -526,23 +566,18 @@ class AnalyticsRepo:
             stmt = self._apply_filter(stmt, key, val)
 
         stmt = stmt.group_by(period, Account.symbol).order_by(period, Account.symbol)
-        result = await self._session.execute(stmt)
+        result = await self._session.stream(stmt.execution_options(yield_per=STREAM_YIELD_PER))
 
-        # Build cumulative sums per symbol
-        cumulative: dict[str, Decimal] = {}
-        rows = []
-        for row in result.all():
-            sym = row.symbol
-            cumulative[sym] = cumulative.get(sym, Decimal(0)) + (row.period_quantity or Decimal(0))
-            rows.append({
+        return [
+            {
                 "period": row.period.isoformat() if row.period else None,
-                "symbol": sym,
-                "period_change": row.period_quantity or Decimal(0),
-                "period_value_usd": row.period_value_usd or Decimal(0),
-                "cumulative_quantity": cumulative[sym],
-            })
-
-        return rows
+                "symbol": row.symbol,
+                "period_change": row.period_quantity,
+                "period_value_usd": row.period_value_usd,
+                "cumulative_quantity": row.cumulative_quantity,
+            }
+            async for row in result
+        ]
 
     # ── 10. Flow by Wallet ───────────────────────────────────────────
 
@@ -563,14 +598,14 @@ class AnalyticsRepo:
                     func.sum(case((JournalSplit.quantity < 0, JournalSplit.value_usd), else_=Decimal(0))), Decimal(0)
                 ).label("outflow_usd"),
             )
-            .select_from(JournalEntry)
-            .join(JournalSplit, JournalSplit.journal_entry_id == JournalEntry.id)
+            .select_from(JournalSplit)
             .join(Account, JournalSplit.account_id == Account.id)
             .join(Wallet, Account.wallet_id == Wallet.id)
             .where(Wallet.entity_id == entity_id)
             .where(Account.account_type == "ASSET")
         )
 
+        stmt = self._join_entries_if_filtered(stmt, f)
         for key, val in f.items():
             stmt = self._apply_filter(stmt, key, val)
 
@@ -582,9 +617,9 @@ class AnalyticsRepo:
                 "wallet_id": str(row.wallet_id),
                 "wallet_label": row.wallet_label,
                 "chain": row.chain,
-                "inflow_usd": row.inflow_usd or Decimal(0),
-                "outflow_usd": row.outflow_usd or Decimal(0),
-                "net_usd": (row.inflow_usd or Decimal(0)) + (row.outflow_usd or Decimal(0)),
+                "inflow_usd": row.inflow_usd,
+                "outflow_usd": row.outflow_usd,
+                "net_usd": row.inflow_usd + row.outflow_usd,
             }
             for row in result.all()
         ]
@@ -598,37 +633,43 @@ class AnalyticsRepo:
 
         chain_col = func.coalesce(OnChainWallet.chain, func.coalesce(Wallet.wallet_type, "unknown")).label("chain")
 
-        stmt = (
+        # One row per (chain, entry), so the outer query counts entries with COUNT(*)
+        per_entry = (
             select(
                 chain_col,
-                func.coalesce(
-                    func.sum(case((JournalSplit.quantity > 0, JournalSplit.value_usd), else_=Decimal(0))), Decimal(0)
-                ).label("inflow_usd"),
-                func.coalesce(
-                    func.sum(case((JournalSplit.quantity < 0, JournalSplit.value_usd), else_=Decimal(0))), Decimal(0)
-                ).label("outflow_usd"),
-                func.count(func.distinct(JournalEntry.id)).label("entry_count"),
+                func.sum(case((JournalSplit.quantity > 0, JournalSplit.value_usd), else_=Decimal(0))).label("inflow_usd"),
+                func.sum(case((JournalSplit.quantity < 0, JournalSplit.value_usd), else_=Decimal(0))).label("outflow_usd"),
             )
-            .select_from(JournalEntry)
-            .join(JournalSplit, JournalSplit.journal_entry_id == JournalEntry.id)
+            .select_from(JournalSplit)
             .join(Account, JournalSplit.account_id == Account.id)
             .join(Wallet, Account.wallet_id == Wallet.id)
             .where(Wallet.entity_id == entity_id)
             .where(Account.account_type == "ASSET")
         )
 
+        per_entry = self._join_entries_if_filtered(per_entry, f)
         for key, val in f.items():
-            stmt = self._apply_filter(stmt, key, val)
+            per_entry = self._apply_filter(per_entry, key, val)
+        per_entry = per_entry.group_by(chain_col, JournalSplit.journal_entry_id).subquery("per_entry")
 
-        stmt = stmt.group_by(chain_col).order_by(chain_col)
+        stmt = (
+            select(
+                per_entry.c.chain,
+                func.coalesce(func.sum(per_entry.c.inflow_usd), Decimal(0)).label("inflow_usd"),
+                func.coalesce(func.sum(per_entry.c.outflow_usd), Decimal(0)).label("outflow_usd"),
+                func.count().label("entry_count"),
+            )
+            .group_by(per_entry.c.chain)
+            .order_by(per_entry.c.chain)
+        )
         result = await self._session.execute(stmt)
 
         return [
             {
                 "chain": row.chain,
-                "inflow_usd": row.inflow_usd or Decimal(0),
-                "outflow_usd": row.outflow_usd or Decimal(0),
-                "net_usd": (row.inflow_usd or Decimal(0)) + (row.outflow_usd or Decimal(0)),
+                "inflow_usd": row.inflow_usd,
+                "outflow_usd": row.outflow_usd,
+                "net_usd": row.inflow_usd + row.outflow_usd,
                 "entry_count": row.entry_count,
             }
             for row in result.all()
@@ -636,20 +677,15 @@ class AnalyticsRepo:
 
     # ── Helper ───────────────────────────────────────────────────────
 
+    @staticmethod
+    def _join_entries_if_filtered(stmt: Select, f: dict[str, Any]) -> Select:
+        """Join journal_entries onto a splits-based query only when a date or entry_type filter needs it."""
+        if _ENTRY_FILTERS.isdisjoint(f):
+            return stmt
+        return stmt.join(JournalEntry, JournalSplit.journal_entry_id == JournalEntry.id)
+
     @staticmethod
     def _apply_filter(stmt, key: str, val: Any):
         """Apply a single filter to a statement."""
-        filter_map = {
-            "date_from": lambda s, v: s.where(JournalEntry.timestamp >= v),
-            "date_to": lambda s, v: s.where(JournalEntry.timestamp <= v),
-            "wallet_id": lambda s, v: s.where(Wallet.id == v),
-            "chain": lambda s, v: s.where(OnChainWallet.chain == v),
-            "symbol": lambda s, v: s.where(Account.symbol == v),
-            "entry_type": lambda s, v: s.where(JournalEntry.entry_type == v),
-            "account_type": lambda s, v: s.where(Account.account_type == v),
-            "protocol": lambda s, v: s.where(Account.protocol == v),
-            "account_subtype": lambda s, v: s.where(Account.subtype == v),
-        }
-        if key in filter_map:
-            return filter_map[key](stmt, val)
-        return stmt
+        criterion = _FILTER_CRITERIA.get(key)
+        return stmt if criterion is None else stmt.where(criterion(val))
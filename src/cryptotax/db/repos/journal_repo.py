@@ -1,8 +1,9 @@
 import uuid
+from collections.abc import Iterable
 from datetime import datetime
 from typing import Optional
 
-from sqlalchemy import func, select
+from sqlalchemy import Select, func, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from cryptotax.db.models.account import Account
@@ -10,6 +11,20 @@ from cryptotax.db.models.journal import JournalEntry, JournalSplit
 from cryptotax.db.models.wallet import Wallet
 
 
+def _unbalanced_entry_ids() -> Select:
+    """journal_entry_ids whose split values don't net to zero (NULL values count as zero, as in validate_balanced)."""
+    return (
+        select(JournalSplit.journal_entry_id)
+        .group_by(JournalSplit.journal_entry_id)
+        .having(
+            or_(
+                func.sum(func.coalesce(JournalSplit.value_usd, 0)) != 0,
+                func.sum(func.coalesce(JournalSplit.value_vnd, 0)) != 0,
+            )
+        )
+    )
+
+
 class JournalRepo:
     def __init__(self, session: AsyncSession) -> None:
         self._session = session
@@ -108,21 +123,27 @@ class JournalRepo:
         await self._session.flush()
         return 1
 
+    async def validate_balanced_bulk(self, entry_ids: Iterable[uuid.UUID]) -> set[uuid.UUID]:
+        """Return the subset of entry_ids whose splits don't sum to zero in USD or VND — one aggregate query."""
+        ids = list(entry_ids)
+        if not ids:
+            return set()
+        result = await self._session.execute(
+            _unbalanced_entry_ids().where(JournalSplit.journal_entry_id.in_(ids))
+        )
+        return set(result.scalars().all())
+
     async def list_unbalanced(self, entity_id: uuid.UUID) -> list[JournalEntry]:
         """Find entries where splits don't sum to zero in USD or VND."""
-        # Get all entries for entity, check balance in Python
-        # (Aggregate query for this is complex; acceptable for moderate volumes)
+        unbalanced_ids = (
+            _unbalanced_entry_ids()
+            .join(JournalEntry, JournalSplit.journal_entry_id == JournalEntry.id)
+            .where(JournalEntry.entity_id == entity_id)
+        )
         result = await self._session.execute(
-            select(JournalEntry).where(JournalEntry.entity_id == entity_id)
+            select(JournalEntry).where(JournalEntry.id.in_(unbalanced_ids))
         )
-        entries = result.scalars().all()
-        unbalanced = []
-        for entry in entries:
-            try:
-                entry.validate_balanced()
-            except Exception:
-                unbalanced.append(entry)
-        return unbalanced
+        return list(result.scalars().all())
 
     async def count_by_entry_type(self, entity_id: uuid.UUID) -> dict[str, int]:
         """Count journal entries grouped by entry_type."""
@@ -2,10 +2,33 @@ import uuid
 from datetime import datetime
 from typing import Optional
 
-from sqlalchemy import func, select
+from sqlalchemy import Row, func, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from cryptotax.db.models.transaction import Transaction
+from cryptotax.db.models.wallet import Wallet
+
+# Columns for list views — everything except the (large) raw tx_data payload
+LIST_COLUMNS = (
+    Transaction.id,
+    Transaction.wallet_id,
+    Transaction.chain,
+    Transaction.tx_hash,
+    Transaction.block_number,
+    Transaction.timestamp,
+    Transaction.from_addr,
+    Transaction.to_addr,
+    Transaction.value_wei,
+    Transaction.gas_used,
+    Transaction.status,
+    Transaction.entry_type,
+    Transaction.created_at,
+)
+
+# Rows per multi-VALUES INSERT when ingesting — keeps bind parameters under driver limits
+INGEST_CHUNK_SIZE = 1000
 
 
 class TransactionRepo:
@@ -22,41 +45,86 @@ class TransactionRepo:
         self._session.add_all(txs)
         await self._session.flush()
 
+    async def bulk_ingest(self, rows: list[dict]) -> int:
+        """Insert column dicts, skipping rows whose (wallet_id, tx_hash) already exists.
+
+        Uses INSERT ... ON CONFLICT DO NOTHING, so no up-front hash lookup is needed.
+        Returns the number of rows actually inserted.
+        """
+        dialect_insert = pg_insert if self._session.get_bind().dialect.name == "postgresql" else sqlite_insert
+        inserted = 0
+        for i in range(0, len(rows), INGEST_CHUNK_SIZE):
+            stmt = (
+                dialect_insert(Transaction)
+                .values(rows[i:i + INGEST_CHUNK_SIZE])
+                .on_conflict_do_nothing(index_elements=["wallet_id", "tx_hash"])
+                .returning(Transaction.id)
+            )
+            result = await self._session.execute(stmt)
+            inserted += len(result.all())
+        return inserted
+
     async def get_by_hash(self, tx_hash: str) -> Optional[Transaction]:
         result = await self._session.execute(
             select(Transaction).where(Transaction.tx_hash == tx_hash)
         )
         return result.scalar_one_or_none()
 
+    async def get_by_hash_with_wallet(self, tx_hash: str) -> Optional[tuple[Transaction, Optional[Wallet]]]:
+        """Fetch a transaction and its wallet in a single round trip."""
+        result = await self._session.execute(
+            select(Transaction, Wallet)
+            .outerjoin(Wallet, Transaction.wallet_id == Wallet.id)
+            .where(Transaction.tx_hash == tx_hash)
+        )
+        row = result.one_or_none()
+        return None if row is None else (row[0], row[1])
+
     async def get_by_id(self, tx_id: int) -> Optional[Transaction]:
         result = await self._session.execute(
             select(Transaction).where(Transaction.id == tx_id)
         )
         return result.scalar_one_or_none()
 
+    async def _page(self, where: list, limit: int, offset: int, join_wallet: bool = False) -> tuple[list[Row], int]:
+        """Fetch one page plus the unfiltered-by-page total in a single statement via COUNT(*) OVER ().
+
+        Rows carry an extra ``total`` column alongside LIST_COLUMNS. Only when the
+        page is empty past offset 0 is a separate COUNT needed to report the total.
+        """
+        stmt = select(*LIST_COLUMNS, func.count().over().label("total"))
+        if join_wallet:
+            stmt = stmt.join(Wallet, Transaction.wallet_id == Wallet.id)
+        result = await self._session.execute(
+            stmt.where(*where)
+            .order_by(Transaction.block_number.desc().nullslast(), Transaction.id.desc())
+            .limit(limit)
+            .offset(offset)
+        )
+        rows = list(result.all())
+        if rows:
+            return rows, rows[0].total
+        if offset == 0:
+            return rows, 0
+
+        count_q = select(func.count()).select_from(Transaction)
+        if join_wallet:
+            count_q = count_q.join(Wallet, Transaction.wallet_id == Wallet.id)
+        total = (await self._session.execute(count_q.where(*where))).scalar_one()
+        return rows, total
+
     async def list_for_wallet(
         self,
         wallet_id: uuid.UUID,
         status: Optional[str] = None,
         limit: int = 50,
         offset: int = 0,
-    ) -> tuple[list[Transaction], int]:
-        base = select(Transaction).where(Transaction.wallet_id == wallet_id)
-        count_q = select(func.count()).select_from(Transaction).where(Transaction.wallet_id == wallet_id)
-
+    ) -> tuple[list[Row], int]:
+        """Page of LIST_COLUMNS rows (not ORM objects) for a wallet, newest block first."""
+        where = [Transaction.wallet_id == wallet_id]
         if status:
-            base = base.where(Transaction.status == status)
-            count_q = count_q.where(Transaction.status == status)
-
-        total_result = await self._session.execute(count_q)
-        total = total_result.scalar_one()
-
-        result = await self._session.execute(
-            base.order_by(Transaction.block_number.desc().nullslast(), Transaction.id.desc())
-            .limit(limit)
-            .offset(offset)
-        )
-        return list(result.scalars().all()), total
+            where.append(Transaction.status == status)
+        return await self._page(where, limit, offset)
 
     async def list_for_entity(
         self,
@@ -67,38 +135,15 @@ class TransactionRepo:
         date_to: Optional[datetime] = None,
         limit: int = 50,
         offset: int = 0,
-    ) -> tuple[list[Transaction], int]:
-        from cryptotax.db.models.wallet import Wallet
-
-        base = select(Transaction).join(Wallet, Transaction.wallet_id == Wallet.id).where(Wallet.entity_id == entity_id)
-        count_q = (
-            select(func.count())
-            .select_from(Transaction)
-            .join(Wallet, Transaction.wallet_id == Wallet.id)
-            .where(Wallet.entity_id == entity_id)
-        )
-
+    ) -> tuple[list[Row], int]:
+        """Page of LIST_COLUMNS rows (not ORM objects) across an entity's wallets, newest block first."""
+        where = [Wallet.entity_id == entity_id]
         if chain:
-            base = base.where(Transaction.chain == chain)
-            count_q = count_q.where(Transaction.chain == chain)
+            where.append(Transaction.chain == chain)
         if status:
-            base = base.where(Transaction.status == status)
-            count_q = count_q.where(Transaction.status == status)
+            where.append(Transaction.status == status)
         if date_from is not None:
-            epoch_from = int(date_from.timestamp())
-            base = base.where(Transaction.timestamp >= epoch_from)
-            count_q = count_q.where(Transaction.timestamp >= epoch_from)
+            where.append(Transaction.timestamp >= int(date_from.timestamp()))
         if date_to is not None:
-            epoch_to = int(date_to.timestamp())
-            base = base.where(Transaction.timestamp <= epoch_to)
-            count_q = count_q.where(Transaction.timestamp <= epoch_to)
-
-        total_result = await self._session.execute(count_q)
-        total = total_result.scalar_one()
-
-        result = await self._session.execute(
-            base.order_by(Transaction.block_number.desc().nullslast(), Transaction.id.desc())
-            .limit(limit)
-            .offset(offset)
-        )
-        return list(result.scalars().all()), total
+            where.append(Transaction.timestamp <= int(date_to.timestamp()))
+        return await self._page(where, limit, offset, join_wallet=True)
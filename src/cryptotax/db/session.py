@@ -1,9 +1,10 @@
+import asyncio
 import uuid
 from datetime import datetime
 from typing import AsyncGenerator
 
-from sqlalchemy import MetaData, func
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy import MetaData, func, text
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 
 convention = {
@@ -28,8 +29,40 @@ class UUIDPrimaryKey:
     id: Mapped[uuid.UUID] = mapped_column(primary_key=True, default=uuid.uuid4)
 
 
-def build_engine(database_url: str, echo: bool = False):
-    return create_async_engine(database_url, echo=echo)
+def build_engine(
+    database_url: str,
+    echo: bool = False,
+    pool_size: int = 5,
+    max_overflow: int = 10,
+    pool_timeout: float = 30.0,
+    pool_recycle: int = -1,
+    pool_pre_ping: bool = False,
+    statement_cache_size: int | None = None,
+    query_cache_size: int = 500,
+) -> AsyncEngine:
+    # asyncpg-only: size of the per-connection prepared statement cache (SQLAlchemy's adapter default is 100)
+    connect_args = {} if statement_cache_size is None else {"prepared_statement_cache_size": statement_cache_size}
+    return create_async_engine(
+        database_url,
+        connect_args=connect_args,
+        echo=echo,
+        pool_size=pool_size,
+        max_overflow=max_overflow,
+        pool_timeout=pool_timeout,
+        pool_recycle=pool_recycle,
+        pool_pre_ping=pool_pre_ping,
+        query_cache_size=query_cache_size,
+    )
+
+
+async def warm_pool(engine: AsyncEngine, size: int) -> None:
+    """Open `size` pooled connections up front so the first requests skip connect latency."""
+
+    async def _ping() -> None:
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+
+    await asyncio.gather(*(_ping() for _ in range(size)))
 
 
 def build_session_factory(engine) -> async_sessionmaker[AsyncSession]:
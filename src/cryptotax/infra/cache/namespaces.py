@@ -0,0 +1,7 @@
+"""Response cache namespaces, shared by the routers that fill them and the writes that invalidate them."""
+
+# GET /api/parse/stats, keyed by entity id (or "all")
+STATS_CACHE_NAMESPACE = "parse_stats"
+
+# Every GET under /api/analytics, keyed by path + sorted query string
+ANALYTICS_CACHE_NAMESPACE = "analytics"
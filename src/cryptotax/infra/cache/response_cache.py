@@ -0,0 +1,44 @@
+import logging
+
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+logger = logging.getLogger(__name__)
+
+
+class ResponseCache:
+    """Redis-backed cache for serialized JSON responses.
+
+    Keys are grouped by namespace so writes can invalidate every variant of an
+    endpoint (e.g. all entity scopes of parse_stats) at once. Redis failures are
+    logged and treated as cache misses — the API never depends on Redis being up.
+    """
+
+    def __init__(self, client: Redis, prefix: str = "leafjots:cache") -> None:
+        self._client = client
+        self._prefix = prefix
+
+    def _key(self, namespace: str, key: str) -> str:
+        return f"{self._prefix}:{namespace}:{key}"
+
+    async def get(self, namespace: str, key: str) -> bytes | None:
+        try:
+            return await self._client.get(self._key(namespace, key))
+        except RedisError:
+            logger.warning("Response cache read failed for %s:%s", namespace, key)
+            return None
+
+    async def set(self, namespace: str, key: str, payload: str, ttl: int) -> None:
+        try:
+            await self._client.set(self._key(namespace, key), payload, ex=ttl)
+        except RedisError:
+            logger.warning("Response cache write failed for %s:%s", namespace, key)
+
+    async def invalidate(self, namespace: str) -> None:
+        """Drop every cached response under a namespace."""
+        try:
+            keys = [k async for k in self._client.scan_iter(match=f"{self._prefix}:{namespace}:*")]
+            if keys:
+                await self._client.delete(*keys)
+        except RedisError:
+            logger.warning("Response cache invalidation failed for %s", namespace)
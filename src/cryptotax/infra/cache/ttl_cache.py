@@ -0,0 +1,44 @@
+import time
+from collections import OrderedDict
+from typing import Generic, Hashable, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class TTLCache(Generic[K, V]):
+    """Bounded in-process cache with per-entry expiry.
+
+    Not thread-safe — intended for module-level use inside a single event loop.
+    Least-recently-inserted entries are evicted once maxsize is reached.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 300.0) -> None:
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._data: OrderedDict[K, tuple[float, V]] = OrderedDict()
+
+    def get(self, key: K) -> V | None:
+        item = self._data.get(key)
+        if item is None:
+            return None
+        expires_at, value = item
+        if expires_at < time.monotonic():
+            del self._data[key]
+            return None
+        return value
+
+    def set(self, key: K, value: V) -> None:
+        self._data.pop(key, None)
+        self._data[key] = (time.monotonic() + self._ttl, value)
+        while len(self._data) > self._maxsize:
+            self._data.popitem(last=False)
+
+    def pop(self, key: K) -> None:
+        self._data.pop(key, None)
+
+    def clear(self) -> None:
+        self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
@@ -2,6 +2,7 @@
 
 import base64
 import hashlib
+from functools import lru_cache
 
 from cryptography.fernet import Fernet
 
@@ -12,13 +13,17 @@ def _derive_key(key: str) -> bytes:
     return base64.urlsafe_b64encode(raw)
 
 
+@lru_cache(maxsize=8)
+def _fernet(key: str) -> Fernet:
+    """Fernet instance per key — derived once per process rather than per call."""
+    return Fernet(_derive_key(key))
+
+
 def encrypt_value(plaintext: str, key: str) -> str:
     """Encrypt a string value. Returns base64-encoded ciphertext."""
-    f = Fernet(_derive_key(key))
-    return f.encrypt(plaintext.encode()).decode()
+    return _fernet(key).encrypt(plaintext.encode()).decode()
 
 
 def decrypt_value(ciphertext: str, key: str) -> str:
     """Decrypt a base64-encoded ciphertext back to plaintext."""
-    f = Fernet(_derive_key(key))
-    return f.decrypt(ciphertext.encode()).decode()
+    return _fernet(key).decrypt(ciphertext.encode()).decode()
@@ -4,11 +4,11 @@ import csv
 import io
 import json
 import logging
+from collections.abc import Iterable
 from datetime import datetime
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from cryptotax.db.models.transaction import Transaction
 from cryptotax.db.models.wallet import CEXWallet
 from cryptotax.db.repos.transaction_repo import TransactionRepo
 from cryptotax.domain.enums import TxStatus
@@ -23,25 +23,29 @@ class BinanceCSVImporter:
         self._session = session
         self._tx_repo = TransactionRepo(session)
 
-    async def import_trades(self, wallet: CEXWallet, csv_content: str) -> int:
-        """Parse CSV and insert as Transactions. Returns count of new TXs."""
-        existing_hashes = await self._tx_repo.get_existing_hashes(wallet.id)
-        new_txs: list[Transaction] = []
+    async def import_trades(self, wallet: CEXWallet, csv_content: str | Iterable[str]) -> int:
+        """Parse CSV and insert as Transactions. Returns count of new TXs.
 
-        reader = csv.DictReader(io.StringIO(csv_content))
+        csv_content is either the whole CSV as a string or any iterable of lines
+        (e.g. a text stream over an upload), which is read row by row.
+        """
+        rows: list[dict] = []
+
+        lines = io.StringIO(csv_content) if isinstance(csv_content, str) else csv_content
+        reader = csv.DictReader(lines)
         for idx, row in enumerate(reader):
-            tx = self._row_to_transaction(wallet, row, idx)
-            if tx is not None and tx.tx_hash not in existing_hashes:
-                new_txs.append(tx)
+            values = self._row_to_values(wallet, row, idx)
+            if values is not None:
+                rows.append(values)
 
-        if new_txs:
-            await self._tx_repo.bulk_insert(new_txs)
+        # Rows already imported for this wallet are skipped by the (wallet_id, tx_hash) constraint
+        new_count = await self._tx_repo.bulk_ingest(rows)
 
-        logger.info("CSV import: %d new TXs for wallet %s", len(new_txs), wallet.id)
-        return len(new_txs)
+        logger.info("CSV import: %d new TXs for wallet %s", new_count, wallet.id)
+        return new_count
 
-    def _row_to_transaction(self, wallet: CEXWallet, row: dict, idx: int) -> Transaction | None:
-        """Convert a CSV row to a Transaction record."""
+    def _row_to_values(self, wallet: CEXWallet, row: dict, idx: int) -> dict | None:
+        """Convert a CSV row to Transaction column values."""
         # Binance CSV format: Date(UTC), Pair, Side, Price, Executed, Amount, Fee
         date_str = row.get("Date(UTC)", row.get("Date", "")).strip()
         pair = row.get("Pair", row.get("Market", "")).strip()
@@ -71,13 +75,13 @@ class BinanceCSVImporter:
             "commissionAsset": row.get("Fee Coin", row.get("Fee Currency", "")),
         }
 
-        return Transaction(
-            wallet_id=wallet.id,
-            chain="binance",
-            tx_hash=tx_hash,
-            timestamp=timestamp,
-            from_addr=wallet.exchange,
-            to_addr=wallet.exchange,
-            status=TxStatus.LOADED.value,
-            tx_data=json.dumps(tx_data),
-        )
+        return {
+            "wallet_id": wallet.id,
+            "chain": "binance",
+            "tx_hash": tx_hash,
+            "timestamp": timestamp,
+            "from_addr": wallet.exchange,
+            "to_addr": wallet.exchange,
+            "status": TxStatus.LOADED.value,
+            "tx_data": json.dumps(tx_data),
+        }
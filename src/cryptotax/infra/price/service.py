@@ -1,9 +1,10 @@
 """PriceService — orchestrates price lookups with DB caching."""
 
 import logging
+from collections.abc import Iterable
 from decimal import Decimal
 
-from sqlalchemy import select
+from sqlalchemy import select, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from cryptotax.config import settings
@@ -13,6 +14,9 @@ from cryptotax.infra.price.cryptocompare import CryptoCompareProvider
 
 logger = logging.getLogger(__name__)
 
+# (symbol, hour) pairs per IN-list query — keeps bind parameters well under driver limits
+PREFETCH_CHUNK_SIZE = 1000
+
 
 def _round_to_hour(timestamp: int) -> int:
     """Round Unix timestamp down to the nearest hour."""
@@ -31,6 +35,23 @@ class PriceService:
         self._session = session
         self._coingecko = coingecko
         self._cryptocompare = cryptocompare
+        # Cached prices loaded in bulk by prefetch(), keyed by (SYMBOL, hour_ts)
+        self._prefetched: dict[tuple[str, int], Decimal] = {}
+
+    async def prefetch(self, lookups: Iterable[tuple[str, int]]) -> None:
+        """Load cached prices for many (symbol, timestamp) pairs up front.
+
+        Later get_price_usd calls for these pairs are answered from memory instead
+        of one cache query each. Pairs without a cached price still go to providers.
+        """
+        keys = list({(symbol.upper(), _round_to_hour(ts)) for symbol, ts in lookups} - self._prefetched.keys())
+        for i in range(0, len(keys), PREFETCH_CHUNK_SIZE):
+            result = await self._session.execute(
+                select(PriceCache.symbol, PriceCache.timestamp, PriceCache.price_usd).where(
+                    tuple_(PriceCache.symbol, PriceCache.timestamp).in_(keys[i:i + PREFETCH_CHUNK_SIZE])
+                )
+            )
+            self._prefetched.update(((symbol, ts), price) for symbol, ts, price in result.all())
 
     async def get_price_usd(self, symbol: str, timestamp: int) -> Decimal | None:
         """Get USD price for a token at a Unix timestamp. Checks cache first."""
@@ -84,6 +105,9 @@ class PriceService:
         return value_usd, value_vnd
 
     async def _cache_lookup(self, symbol: str, hour_ts: int) -> Decimal | None:
+        prefetched = self._prefetched.get((symbol, hour_ts))
+        if prefetched is not None:
+            return prefetched
         result = await self._session.execute(
             select(PriceCache.price_usd).where(
                 PriceCache.symbol == symbol,
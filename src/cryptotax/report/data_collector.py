@@ -20,6 +20,9 @@ from cryptotax.db.models.entity import Entity
 from cryptotax.db.models.journal import JournalEntry
 from cryptotax.db.models.wallet import OnChainWallet
 
+# Rows fetched per round-trip when streaming lot tables through a server-side cursor
+STREAM_YIELD_PER = 500
+
 
 @dataclass
 class ReportData:
@@ -65,8 +68,8 @@ class ReportDataCollector:
         # Load all data in parallel-ish queries
         entries = await self._load_journal_entries(entity_id, start, end)
         accounts_map = await self._load_accounts_map(entries)
-        closed_lots = await self._load_closed_lots(entity_id)
-        open_lots = await self._load_open_lots(entity_id)
+        realized_gains = await self._stream_realized_gains(entity_id)
+        open_lot_rows = await self._stream_open_lots(entity_id)
         wallets = await self._load_wallets(entity_id)
         entity = await self._load_entity(entity_id)
 
@@ -78,8 +81,8 @@ class ReportDataCollector:
         data.income_statement = self._build_income_statement(entries, accounts_map, vnd_rate)
         data.flows_qty = self._build_flows(entries, accounts_map, "qty")
         data.flows_usd = self._build_flows(entries, accounts_map, "usd")
-        data.realized_gains = self._build_realized_gains(closed_lots)
-        data.open_lots = self._build_open_lots(open_lots)
+        data.realized_gains = realized_gains
+        data.open_lots = open_lot_rows
         data.journal = self._build_journal(entries, accounts_map)
         data.tax_summary = self._build_tax_summary(tax_result)
         data.warnings = self._build_warnings(entries)
@@ -119,21 +122,25 @@ class ReportDataCollector:
         )
         return {acc.id: acc for acc in result.scalars().all()}
 
-    async def _load_closed_lots(self, entity_id: uuid.UUID) -> list[ClosedLotRecord]:
-        result = await self._session.execute(
+    async def _stream_realized_gains(self, entity_id: uuid.UUID) -> list[tuple]:
+        # Lot tables grow with the whole history, not just the period — stream them
+        # and keep only the row tuples instead of every ORM object at once.
+        result = await self._session.stream_scalars(
             select(ClosedLotRecord)
             .where(ClosedLotRecord.entity_id == entity_id)
             .order_by(ClosedLotRecord.sell_timestamp.asc())
+            .execution_options(yield_per=STREAM_YIELD_PER)
         )
-        return list(result.scalars().all())
+        return [self._realized_gain_row(cl) async for cl in result]
 
-    async def _load_open_lots(self, entity_id: uuid.UUID) -> list[OpenLotRecord]:
-        result = await self._session.execute(
+    async def _stream_open_lots(self, entity_id: uuid.UUID) -> list[tuple]:
+        result = await self._session.stream_scalars(
             select(OpenLotRecord)
             .where(OpenLotRecord.entity_id == entity_id)
             .order_by(OpenLotRecord.buy_timestamp.asc())
+            .execution_options(yield_per=STREAM_YIELD_PER)
         )
-        return list(result.scalars().all())
+        return [self._open_lot_row(ol) async for ol in result]
 
     async def _load_wallets(self, entity_id: uuid.UUID) -> list[OnChainWallet]:
         result = await self._session.execute(
@@ -245,32 +252,28 @@ class ReportDataCollector:
                     ))
         return rows
 
-    def _build_realized_gains(self, closed_lots: list[ClosedLotRecord]) -> list[tuple]:
-        return [
-            (
-                cl.symbol,
-                float(cl.quantity),
-                float(cl.cost_basis_usd),
-                float(cl.proceeds_usd),
-                float(cl.gain_usd),
-                cl.holding_days,
-                cl.buy_timestamp.strftime("%Y-%m-%d") if cl.buy_timestamp else "",
-                cl.sell_timestamp.strftime("%Y-%m-%d") if cl.sell_timestamp else "",
-            )
-            for cl in closed_lots
-        ]
+    @staticmethod
+    def _realized_gain_row(cl: ClosedLotRecord) -> tuple:
+        return (
+            cl.symbol,
+            float(cl.quantity),
+            float(cl.cost_basis_usd),
+            float(cl.proceeds_usd),
+            float(cl.gain_usd),
+            cl.holding_days,
+            cl.buy_timestamp.strftime("%Y-%m-%d") if cl.buy_timestamp else "",
+            cl.sell_timestamp.strftime("%Y-%m-%d") if cl.sell_timestamp else "",
+        )
 
-    def _build_open_lots(self, open_lots: list[OpenLotRecord]) -> list[tuple]:
-        return [
-            (
-                ol.symbol,
-                float(ol.remaining_quantity),
-                float(ol.cost_basis_per_unit_usd),
-                float(ol.remaining_quantity * ol.cost_basis_per_unit_usd),
-                ol.buy_timestamp.strftime("%Y-%m-%d") if ol.buy_timestamp else "",
-            )
-            for ol in open_lots
-        ]
+    @staticmethod
+    def _open_lot_row(ol: OpenLotRecord) -> tuple:
+        return (
+            ol.symbol,
+            float(ol.remaining_quantity),
+            float(ol.cost_basis_per_unit_usd),
+            float(ol.remaining_quantity * ol.cost_basis_per_unit_usd),
+            ol.buy_timestamp.strftime("%Y-%m-%d") if ol.buy_timestamp else "",
+        )
 
     def _build_journal(self, entries, accounts_map) -> list[tuple]:
         rows = []
@@ -3,6 +3,7 @@
 from io import BytesIO
 
 from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
 from openpyxl.styles import Font
 from openpyxl.utils import get_column_letter
 
@@ -101,42 +102,48 @@ HEADER_FONT = Font(bold=True)
 
 
 class ExcelWriter:
-    """Writes ReportData to an in-memory Excel buffer."""
+    """Writes ReportData to an in-memory Excel buffer.
+
+    Uses openpyxl's write-only mode: rows are serialized as they are appended
+    instead of being kept as a grid of Cell objects, so memory stays close to
+    the size of ReportData itself.
+    """
 
     def write_to_buffer(self, data: ReportData) -> BytesIO:
         """Create a complete bangketoan.xlsx workbook and return as BytesIO."""
-        wb = Workbook()
-
-        for idx, (sheet_name, headers, data_attr, num_fmts) in enumerate(SHEET_DEFS):
-            if idx == 0:
-                ws = wb.active
-                ws.title = sheet_name
-            else:
-                ws = wb.create_sheet(title=sheet_name)
-
-            # Header row
-            for col_idx, header in enumerate(headers, start=1):
-                cell = ws.cell(row=1, column=col_idx, value=header)
-                cell.font = HEADER_FONT
+        wb = Workbook(write_only=True)
 
-            # Data rows
+        for sheet_name, headers, data_attr, num_fmts in SHEET_DEFS:
+            ws = wb.create_sheet(title=sheet_name)
             sheet_data = getattr(data, data_attr, [])
-
             if data_attr == "warnings":
                 # Warnings is a list of strings, not tuples
-                for row_idx, warning in enumerate(sheet_data, start=2):
-                    ws.cell(row=row_idx, column=1, value=warning)
-            else:
-                for row_idx, row in enumerate(sheet_data, start=2):
-                    for col_idx, value in enumerate(row, start=1):
-                        cell = ws.cell(row=row_idx, column=col_idx, value=value)
-                        # Apply number format if defined
-                        fmt = num_fmts.get(col_idx - 1)  # col_idx is 1-based, num_fmts keys are 0-based
-                        if fmt:
-                            cell.number_format = fmt
-
-            # Auto-fit column widths (approximate)
-            _auto_fit_columns(ws)
+                sheet_data = [(warning,) for warning in sheet_data]
+
+            # Write-only sheets need column widths before the first row
+            _auto_fit_columns(ws, headers, sheet_data)
+
+            header_row = []
+            for header in headers:
+                cell = WriteOnlyCell(ws, value=header)
+                cell.font = HEADER_FONT
+                header_row.append(cell)
+            ws.append(header_row)
+
+            for row in sheet_data:
+                if not num_fmts:
+                    ws.append(row)
+                    continue
+                out = []
+                for col_idx, value in enumerate(row):
+                    fmt = num_fmts.get(col_idx)
+                    if fmt:
+                        cell = WriteOnlyCell(ws, value=value)
+                        cell.number_format = fmt
+                        out.append(cell)
+                    else:
+                        out.append(value)
+                ws.append(out)
 
         buf = BytesIO()
         wb.save(buf)
@@ -144,15 +151,18 @@ class ExcelWriter:
         return buf
 
 
-def _auto_fit_columns(ws) -> None:
+def _auto_fit_columns(ws, headers: list[str], rows) -> None:
     """Set column widths based on content (approximate)."""
-    for col_cells in ws.columns:
-        max_len = 0
-        col_letter = get_column_letter(col_cells[0].column)
-        for cell in col_cells:
-            if cell.value is not None:
-                cell_len = len(str(cell.value))
-                if cell_len > max_len:
-                    max_len = cell_len
+    widths = [len(h) for h in headers]
+    for row in rows:
+        for col_idx, value in enumerate(row):
+            if value is None:
+                continue
+            cell_len = len(str(value))
+            if col_idx >= len(widths):
+                widths.append(cell_len)
+            elif cell_len > widths[col_idx]:
+                widths[col_idx] = cell_len
+    for col_idx, max_len in enumerate(widths, start=1):
         # Add padding, cap at 50
-        ws.column_dimensions[col_letter].width = min(max_len + 3, 50)
+        ws.column_dimensions[get_column_letter(col_idx)].width = min(max_len + 3, 50)
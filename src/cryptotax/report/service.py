@@ -1,5 +1,6 @@
 """ReportService — orchestrates report generation."""
 
+import asyncio
 import logging
 import uuid
 from datetime import datetime
@@ -18,6 +19,11 @@ logger = logging.getLogger(__name__)
 REPORTS_DIR = Path("reports")
 
 
+def _save_report(path: Path, buf: BytesIO) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(buf.getbuffer())
+
+
 class ReportService:
     """Orchestrates data collection → Excel generation → persistence."""
 
@@ -52,10 +58,9 @@ class ReportService:
             writer = ExcelWriter()
             buf = writer.write_to_buffer(report_data)
 
-            # Save to disk
-            REPORTS_DIR.mkdir(parents=True, exist_ok=True)
+            # Save to disk (off the event loop)
             file_path = REPORTS_DIR / f"{record.id}_{filename}"
-            file_path.write_bytes(buf.getvalue())
+            await asyncio.to_thread(_save_report, file_path, buf)
 
             # Update record
             record.status = "completed"
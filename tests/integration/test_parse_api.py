@@ -3,6 +3,7 @@ import uuid
 
 import pytest
 from httpx import ASGITransport, AsyncClient
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 
 from cryptotax.api.deps import get_db
@@ -89,6 +90,7 @@ class TestParseAPI:
         assert data["tx_hash"] == tx_hash
         assert data["balanced"] is True
         assert len(data["splits"]) > 0
+        assert all(s["account_label"] != "unknown" for s in data["splits"])
 
     async def test_parse_test_not_found(self, client):
         ac, _ = client
@@ -118,6 +120,32 @@ class TestParseAPI:
         assert data["parsed"] >= 0  # May be 1 if parse succeeded
 
 
+class TestAccountInfoCache:
+    async def test_cached_accounts_are_not_requeried(self, session):
+        from cryptotax.api.parser import _account_info
+        from cryptotax.db.models.account import NativeAsset
+
+        account = NativeAsset(wallet_id=uuid.uuid4(), account_type="ASSET", symbol="ETH", label=f"eth:{uuid.uuid4()}")
+        session.add(account)
+        await session.flush()
+
+        first = await _account_info(session, {account.id})
+        assert first[account.id] == (account.label, "ASSET", "ETH")
+
+        statements: list[str] = []
+
+        def _record(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        engine = session.bind.sync_engine
+        event.listen(engine, "before_cursor_execute", _record)
+        try:
+            assert await _account_info(session, {account.id}) == first
+        finally:
+            event.remove(engine, "before_cursor_execute", _record)
+        assert statements == []
+
+
 class TestJournalAPI:
     async def test_journal_empty(self, client):
         ac, _ = client
@@ -151,6 +179,44 @@ class TestJournalAPI:
             assert detail_res.status_code == 200
             assert "splits" in detail_res.json()
 
+    async def test_reprice_fills_null_values_from_price_cache(self, client):
+        from datetime import datetime
+        from decimal import Decimal
+
+        from cryptotax.db.models.account import NativeAsset
+        from cryptotax.db.models.entity import Entity
+        from cryptotax.db.models.journal import JournalEntry, JournalSplit
+        from cryptotax.db.models.price_cache import PriceCache
+        from cryptotax.db.models.wallet import OnChainWallet
+
+        ac, factory = client
+        async with factory() as session:
+            entity = Entity(name="Reprice", base_currency="VND")
+            session.add(entity)
+            await session.flush()
+            wallet = OnChainWallet(entity_id=entity.id, chain="ethereum", address="0xabc")
+            session.add(wallet)
+            await session.flush()
+            account = NativeAsset(wallet_id=wallet.id, account_type="ASSET", symbol="ETH", label="reprice:eth")
+            session.add(account)
+            await session.flush()
+            session.add(PriceCache(symbol="ETH", timestamp=1699999200, price_usd=Decimal("2000"), source="test"))
+            session.add(JournalEntry(
+                entity_id=entity.id,
+                entry_type="TRANSFER",
+                timestamp=datetime.fromtimestamp(1700000000),
+                splits=[
+                    JournalSplit(account_id=account.id, quantity=Decimal("1")),
+                    JournalSplit(account_id=account.id, quantity=Decimal("-0.5")),
+                ],
+            ))
+            await session.commit()
+            entity_id = entity.id
+
+        res = await ac.post(f"/api/journal/reprice?entity_id={entity_id}")
+        assert res.status_code == 200
+        assert res.json() == {"updated": 2, "still_null": 0, "total_null_before": 2, "unmapped_symbols": []}
+
 
 class TestAccountsAPI:
     async def test_accounts_empty(self, client):
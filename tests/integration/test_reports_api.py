@@ -84,6 +84,35 @@ class TestReportsGenerateAPI:
         assert data["filename"] is not None
         assert "bangketoan" in data["filename"]
 
+    async def test_generate_period_covers_end_date(self, report_client):
+        client, entity = report_client
+        resp = await client.post("/api/reports/generate", json={
+            "entity_id": str(entity.id),
+            "start_date": "2025-01-01",
+            "end_date": "2025-12-31",
+        })
+        data = resp.json()
+        assert data["period_start"] == "2025-01-01T00:00:00"
+        assert data["period_end"] == "2025-12-31T23:59:59"
+
+    async def test_generate_invalid_date_returns_422(self, report_client):
+        client, entity = report_client
+        resp = await client.post("/api/reports/generate", json={
+            "entity_id": str(entity.id),
+            "start_date": "not-a-date",
+            "end_date": "2025-12-31",
+        })
+        assert resp.status_code == 422
+
+    async def test_period_strings_parse_once(self, report_client):
+        from cryptotax.api.schemas.reports import ReportGenerateRequest, _parse_period_bound
+
+        first = ReportGenerateRequest(start_date="2025-01-01", end_date="2025-03-31T08:00:00+07:00")
+        second = ReportGenerateRequest(start_date="2025-01-01", end_date="2025-03-31T08:00:00+07:00")
+        assert first.start_date is second.start_date
+        assert second.end_date == datetime(2025, 3, 31, 23, 59, 59)
+        assert _parse_period_bound.cache_info().hits >= 2
+
     async def test_generate_default_entity(self, report_client):
         client, _ = report_client
         resp = await client.post("/api/reports/generate", json={
@@ -151,7 +180,131 @@ class TestReportsDownloadAPI:
         assert "attachment" in resp.headers["content-disposition"]
         assert len(resp.content) > 0
 
+    async def test_download_supports_range_requests(self, report_client):
+        client, entity = report_client
+        gen_resp = await client.post("/api/reports/generate", json={
+            "entity_id": str(entity.id),
+            "start_date": "2025-01-01",
+            "end_date": "2025-12-31",
+        })
+        report_id = gen_resp.json()["id"]
+
+        resp = await client.get(f"/api/reports/{report_id}/download", headers={"Range": "bytes=0-1"})
+        assert resp.status_code == 206
+        assert resp.content == b"PK"
+
+    async def test_malformed_report_id_returns_422(self, report_client):
+        client, _ = report_client
+        assert (await client.get("/api/reports/not-a-uuid/status")).status_code == 422
+        assert (await client.get("/api/reports/not-a-uuid/download")).status_code == 422
+
     async def test_download_not_found(self, report_client):
         client, _ = report_client
         resp = await client.get("/api/reports/00000000-0000-0000-0000-000000000000/download")
         assert resp.status_code == 404
+
+    async def test_download_sets_content_length(self, report_client):
+        client, entity = report_client
+        resp = await client.post("/api/reports/download", json={
+            "entity_id": str(entity.id),
+            "start_date": "2025-01-01",
+            "end_date": "2025-12-31",
+        })
+        assert resp.status_code == 200
+        assert int(resp.headers["content-length"]) == len(resp.content)
+        assert resp.content[:2] == b"PK"
+
+
+class TestReportsListCache:
+    async def test_generate_invalidates_cached_list(self, report_client, monkeypatch):
+        from cryptotax.infra.cache.response_cache import ResponseCache
+        from tests.unit.infra.test_response_cache import FakeRedis
+
+        client, entity = report_client
+        cache = ResponseCache(FakeRedis())
+        monkeypatch.setattr(app.state, "response_cache", cache, raising=False)
+
+        assert (await client.get("/api/reports")).json() == []
+        assert await cache.get("reports", "all") == b"[]"
+
+        await client.post("/api/reports/generate", json={
+            "entity_id": str(entity.id),
+            "start_date": "2025-01-01",
+            "end_date": "2025-12-31",
+        })
+        assert await cache.get("reports", "all") is None
+        assert len((await client.get("/api/reports")).json()) == 1
+
+
+class TestReportsEntityCache:
+    async def test_resolved_entity_cached_until_entity_deleted(self, report_client):
+        from cryptotax.api.deps import get_entity_cache
+        from cryptotax.infra.cache.ttl_cache import TTLCache
+
+        client, entity = report_client
+        cache = TTLCache(maxsize=8, ttl=60)
+        app.dependency_overrides[get_entity_cache] = lambda: cache
+        body = {"start_date": "2025-01-01", "end_date": "2025-12-31"}
+
+        resp = await client.post("/api/reports/generate", json=body)
+        assert resp.json()["entity_id"] == str(entity.id)
+        assert cache.get("default") == entity.id
+
+        await client.delete(f"/api/entities/{entity.id}")
+        assert len(cache) == 0
+        resp = await client.post("/api/reports/generate", json=body)
+        assert resp.status_code == 404
+
+
+class TestReportsGenerateBatch:
+    @pytest.fixture()
+    async def batch_client(self, tmp_path, monkeypatch):
+        # Each batch item opens its own session, so use a file DB rather than the shared in-memory one
+        from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+        from cryptotax.api.deps import get_db, get_session_factory
+        from cryptotax.config import settings
+        from cryptotax.db.session import Base
+
+        monkeypatch.setattr(settings, "db_pool_size", 2)
+        engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'batch.db'}")
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        factory = async_sessionmaker(engine, expire_on_commit=False)
+
+        async with factory() as session:
+            entity = await _setup_report_data(session)
+            app.dependency_overrides[get_db] = lambda: session
+            app.dependency_overrides[get_session_factory] = lambda: factory
+            transport = ASGITransport(app=app)
+            async with AsyncClient(transport=transport, base_url="http://test") as client:
+                yield client, entity
+        app.dependency_overrides.clear()
+        await engine.dispose()
+
+    async def test_generates_each_item_in_order(self, batch_client):
+        client, entity = batch_client
+        resp = await client.post("/api/reports/generate-batch", json={"items": [
+            {"entity_id": str(entity.id), "start_date": "2025-01-01", "end_date": "2025-06-30"},
+            {"entity_id": str(entity.id), "start_date": "2025-07-01", "end_date": "2025-12-31"},
+        ]})
+        assert resp.status_code == 200
+        data = resp.json()
+        assert [r["status"] for r in data] == ["completed", "completed"]
+        assert data[0]["period_end"].startswith("2025-06-30")
+        assert data[1]["period_start"].startswith("2025-07-01")
+
+        listed = await client.get("/api/reports", params={"entity_id": str(entity.id)})
+        assert len(listed.json()) == 2
+
+    async def test_unknown_entity_returns_404(self, batch_client):
+        client, _ = batch_client
+        resp = await client.post("/api/reports/generate-batch", json={"items": [
+            {"entity_id": "00000000-0000-0000-0000-000000000000", "start_date": "2025-01-01", "end_date": "2025-12-31"},
+        ]})
+        assert resp.status_code == 404
+
+    async def test_empty_batch_returns_422(self, batch_client):
+        client, _ = batch_client
+        resp = await client.post("/api/reports/generate-batch", json={"items": []})
+        assert resp.status_code == 422
@@ -159,6 +159,8 @@ class TestTaxReadEndpoints:
         gains = resp.json()
         assert len(gains) > 0
         assert "gain_usd" in gains[0]
+        assert isinstance(gains[0]["gain_usd"], float)
+        assert isinstance(gains[0]["quantity"], float)
 
     async def test_open_lots_after_calculate(self, tax_client):
         client, entity = tax_client
@@ -172,9 +174,75 @@ class TestTaxReadEndpoints:
         lots = resp.json()
         assert len(lots) > 0
         assert "remaining_quantity" in lots[0]
+        assert isinstance(lots[0]["remaining_quantity"], float)
 
     async def test_summary_empty(self, tax_client):
         client, _ = tax_client
         resp = await client.get("/api/tax/summary")
         assert resp.status_code == 200
         # Could be null or empty
+
+    async def test_summary_after_calculate_matches_lots(self, tax_client):
+        client, entity = tax_client
+        calc = (await client.post("/api/tax/calculate", json={
+            "entity_id": str(entity.id),
+            "start_date": "2025-01-01",
+            "end_date": "2025-12-31",
+        })).json()["summary"]
+
+        resp = await client.get("/api/tax/summary", params={"entity_id": str(entity.id)})
+        assert resp.status_code == 200
+        summary = resp.json()
+        assert summary["closed_lot_count"] == calc["closed_lot_count"]
+        assert summary["open_lot_count"] == calc["open_lot_count"]
+        assert Decimal(summary["total_realized_gain_usd"]) == Decimal(calc["total_realized_gain_usd"])
+
+    async def test_calculate_invalid_date_returns_422(self, tax_client):
+        client, entity = tax_client
+        resp = await client.post("/api/tax/calculate", json={
+            "entity_id": str(entity.id),
+            "start_date": "2025-13-01",
+            "end_date": "2025-12-31",
+        })
+        assert resp.status_code == 422
+
+    async def test_calculate_period_covers_end_date(self, tax_client):
+        client, entity = tax_client
+        resp = await client.post("/api/tax/calculate", json={
+            "entity_id": str(entity.id),
+            "start_date": "2025-01-01",
+            "end_date": "2025-12-31",
+        })
+        summary = resp.json()["summary"]
+        assert summary["period_start"] == "2025-01-01T00:00:00"
+        assert summary["period_end"] == "2025-12-31T23:59:59"
+
+
+class TestAnalyticsResponseCache:
+    async def test_repeat_reads_cached_until_calculate(self, tax_client, monkeypatch):
+        from cryptotax.infra.cache.namespaces import ANALYTICS_CACHE_NAMESPACE
+        from cryptotax.infra.cache.response_cache import ResponseCache
+        from tests.unit.infra.test_response_cache import FakeRedis
+
+        client, entity = tax_client
+        cache = ResponseCache(FakeRedis())
+        monkeypatch.setattr(app.state, "response_cache", cache, raising=False)
+        url = f"/api/analytics/top-symbols?limit=5&entity_id={entity.id}"
+        key = f"/api/analytics/top-symbols?entity_id={entity.id}&limit=5"
+
+        first = await client.get(url)
+        assert first.status_code == 200
+        assert await cache.get(ANALYTICS_CACHE_NAMESPACE, key) == first.content
+
+        # Different filters get their own entry
+        await client.get(f"/api/analytics/top-symbols?limit=1&entity_id={entity.id}")
+        other_key = f"/api/analytics/top-symbols?entity_id={entity.id}&limit=1"
+        assert await cache.get(ANALYTICS_CACHE_NAMESPACE, other_key) is not None
+        assert (await client.get(url)).content == first.content
+
+        await client.post("/api/tax/calculate", json={
+            "entity_id": str(entity.id),
+            "start_date": "2025-01-01",
+            "end_date": "2025-12-31",
+        })
+        assert await cache.get(ANALYTICS_CACHE_NAMESPACE, key) is None
@@ -127,3 +127,24 @@ class TestWalletsAPI:
         res = await client.get("/api/health")
         assert res.status_code == 200
         assert res.json()["status"] == "ok"
+
+    async def test_import_csv_invalidates_cached_parse_stats(self, client, monkeypatch):
+        from cryptotax.infra.cache.namespaces import STATS_CACHE_NAMESPACE
+        from cryptotax.infra.cache.response_cache import ResponseCache
+        from tests.unit.infra.test_response_cache import FakeRedis
+
+        cache = ResponseCache(FakeRedis())
+        monkeypatch.setattr(app.state, "response_cache", cache, raising=False)
+        wallet_id = (await client.post("/api/wallets/cex", json={"exchange": "binance"})).json()["id"]
+
+        assert (await client.get("/api/parse/stats")).json()["total"] == 0
+        assert await cache.get(STATS_CACHE_NAMESPACE, "all") is not None
+
+        csv_body = (
+            "Date(UTC),Pair,Side,Price,Executed,Amount,Fee,Fee Coin\n"
+            "2024-01-15 10:30:00,BTCUSDT,BUY,42000.00,0.5,21000.00,0.001,BTC\n"
+        )
+        res = await client.post(f"/api/wallets/{wallet_id}/import-csv", files={"file": ("trades.csv", csv_body, "text/csv")})
+        assert res.json() == {"imported": 1}
+        assert await cache.get(STATS_CACHE_NAMESPACE, "all") is None
+        assert (await client.get("/api/parse/stats")).json()["total"] == 1
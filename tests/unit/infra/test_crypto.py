@@ -0,0 +1,19 @@
+"""Tests for CEX credential encryption helpers."""
+
+from cryptotax.infra.cex.crypto import _fernet, decrypt_value, encrypt_value
+
+
+class TestCrypto:
+    def test_round_trip(self):
+        token = encrypt_value("api-secret", "some-key")
+        assert token != "api-secret"
+        assert decrypt_value(token, "some-key") == "api-secret"
+
+    def test_fernet_derived_once_per_key(self):
+        _fernet.cache_clear()
+        encrypt_value("a", "k1")
+        encrypt_value("b", "k1")
+        decrypt_value(encrypt_value("c", "k2"), "k2")
+        info = _fernet.cache_info()
+        assert info.misses == 2
+        assert info.hits == 2
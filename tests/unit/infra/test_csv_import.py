@@ -1,5 +1,7 @@
 """Tests for BinanceCSVImporter."""
 
+import io
+
 import pytest
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -41,6 +43,22 @@ class TestBinanceCSVImporter:
         count = await importer.import_trades(cex_wallet, SAMPLE_CSV)
         assert count == 2
 
+    async def test_import_from_text_stream(self, session, cex_wallet):
+        importer = BinanceCSVImporter(session)
+        stream = io.TextIOWrapper(io.BytesIO(SAMPLE_CSV.encode()), encoding="utf-8", newline="")
+        count = await importer.import_trades(cex_wallet, stream)
+        assert count == 2
+
+    async def test_import_large_csv(self, session, cex_wallet):
+        header = "Date(UTC),Pair,Side,Price,Executed,Amount,Fee,Fee Coin\n"
+        body = "".join(
+            f"2024-01-15 10:{i // 60 % 60:02d}:{i % 60:02d},BTCUSDT,BUY,42000,0.1,4200,0.001,BTC\n"
+            for i in range(2500)
+        )
+        importer = BinanceCSVImporter(session)
+        assert await importer.import_trades(cex_wallet, header + body) == 2500
+        assert await importer.import_trades(cex_wallet, header + body) == 0
+
     async def test_import_alt_format(self, session, cex_wallet):
         importer = BinanceCSVImporter(session)
         count = await importer.import_trades(cex_wallet, SAMPLE_CSV_ALT)
@@ -0,0 +1,63 @@
+"""Tests for ResponseCache — namespaced keys, invalidation, Redis failure tolerance."""
+
+import fnmatch
+from unittest.mock import AsyncMock
+
+from redis.exceptions import ConnectionError as RedisConnectionError
+
+from cryptotax.infra.cache.response_cache import ResponseCache
+
+
+class FakeRedis:
+    """Minimal in-memory stand-in for the redis.asyncio commands ResponseCache uses."""
+
+    def __init__(self) -> None:
+        self.store: dict[str, bytes] = {}
+        self.ttls: dict[str, int] = {}
+
+    async def get(self, key: str) -> bytes | None:
+        return self.store.get(key)
+
+    async def set(self, key: str, value: str, ex: int | None = None) -> None:
+        self.store[key] = value.encode()
+        if ex is not None:
+            self.ttls[key] = ex
+
+    async def scan_iter(self, match: str):
+        for key in list(self.store):
+            if fnmatch.fnmatch(key, match):
+                yield key
+
+    async def delete(self, *keys: str) -> None:
+        for key in keys:
+            self.store.pop(key, None)
+
+
+class TestResponseCache:
+    async def test_set_then_get_round_trips_with_ttl(self):
+        redis = FakeRedis()
+        cache = ResponseCache(redis)
+        await cache.set("parse_stats", "all", '{"total": 3}', ttl=15)
+        assert await cache.get("parse_stats", "all") == b'{"total": 3}'
+        assert redis.ttls["leafjots:cache:parse_stats:all"] == 15
+
+    async def test_invalidate_drops_only_that_namespace(self):
+        cache = ResponseCache(FakeRedis())
+        await cache.set("parse_stats", "all", "{}", ttl=15)
+        await cache.set("parse_stats", "e1", "{}", ttl=15)
+        await cache.set("reports", "all", "[]", ttl=30)
+
+        await cache.invalidate("parse_stats")
+
+        assert await cache.get("parse_stats", "all") is None
+        assert await cache.get("parse_stats", "e1") is None
+        assert await cache.get("reports", "all") == b"[]"
+
+    async def test_redis_errors_are_cache_misses(self):
+        client = AsyncMock()
+        client.get.side_effect = RedisConnectionError("down")
+        client.set.side_effect = RedisConnectionError("down")
+        cache = ResponseCache(client)
+
+        assert await cache.get("parse_stats", "all") is None
+        await cache.set("parse_stats", "all", "{}", ttl=15)
@@ -0,0 +1,42 @@
+"""Tests for TTLCache — expiry and size bound."""
+
+from unittest.mock import patch
+
+from cryptotax.infra.cache.ttl_cache import TTLCache
+
+
+class TestTTLCache:
+    def test_get_returns_stored_value(self):
+        cache: TTLCache[str, int] = TTLCache(maxsize=4, ttl=60)
+        cache.set("a", 1)
+        assert cache.get("a") == 1
+        assert cache.get("missing") is None
+
+    def test_entry_expires_after_ttl(self):
+        cache: TTLCache[str, int] = TTLCache(maxsize=4, ttl=10)
+        with patch("cryptotax.infra.cache.ttl_cache.time.monotonic", return_value=100.0):
+            cache.set("a", 1)
+        with patch("cryptotax.infra.cache.ttl_cache.time.monotonic", return_value=109.0):
+            assert cache.get("a") == 1
+        with patch("cryptotax.infra.cache.ttl_cache.time.monotonic", return_value=111.0):
+            assert cache.get("a") is None
+        assert len(cache) == 0
+
+    def test_oldest_entry_evicted_at_maxsize(self):
+        cache: TTLCache[str, int] = TTLCache(maxsize=2, ttl=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.set("c", 3)
+        assert cache.get("a") is None
+        assert cache.get("b") == 2
+        assert cache.get("c") == 3
+
+    def test_pop_and_clear(self):
+        cache: TTLCache[str, int] = TTLCache()
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.pop("a")
+        cache.pop("missing")
+        assert cache.get("a") is None
+        cache.clear()
+        assert len(cache) == 0
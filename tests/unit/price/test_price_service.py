@@ -79,3 +79,24 @@ class TestPriceSplit:
         value_usd, value_vnd = await service.price_split("UNKNOWN", Decimal("1"), 1700000000)
         assert value_usd is None
         assert value_vnd is None
+
+
+class TestPriceServicePrefetch:
+    async def test_prefetch_answers_lookups_without_queries(self, session):
+        session.add(PriceCache(symbol="ETH", timestamp=1699999200, price_usd=Decimal("2000"), source="test"))
+        session.add(PriceCache(symbol="USDC", timestamp=1699999200, price_usd=Decimal("1"), source="test"))
+        await session.flush()
+
+        service = PriceService(session, coingecko=None)
+        await service.prefetch([("eth", 1700000000), ("USDC", 1699999300), ("BTC", 1700000000)])
+
+        execute = session.execute
+        session.execute = AsyncMock(side_effect=AssertionError("unexpected query"))
+        try:
+            assert await service.get_price_usd("ETH", 1700000000) == Decimal("2000")
+            assert await service.get_price_usd("USDC", 1700000000) == Decimal("1")
+        finally:
+            session.execute = execute
+
+        # Pairs with no cached price still fall back to a lookup
+        assert await service.get_price_usd("BTC", 1700000000) is None
@@ -113,3 +113,12 @@ class TestExcelWriterWithData:
         ws = wb["wallets"]
         assert ws.cell(row=2, column=1).value == "ethereum"
         assert ws.cell(row=2, column=2).value == "0xabc"
+
+    def test_number_formats_and_header_font_survive_write_only_mode(self):
+        data = ReportData(balance_sheet_usd=[("ASSET", "native_asset", "ETH", "ETH", 2500.0)])
+        buf = ExcelWriter().write_to_buffer(data)
+
+        ws = load_workbook(buf)["balance_sheet_by_value_USD"]
+        assert ws.cell(row=1, column=1).font.bold
+        assert ws.cell(row=2, column=5).number_format == "$#,##0.00"
+        assert ws.column_dimensions["E"].width == len("Value (USD)") + 3
@@ -0,0 +1,82 @@
+from datetime import UTC, datetime
+from decimal import Decimal
+
+from cryptotax.db.models.account import ERC20Token, NativeAsset
+from cryptotax.db.models.entity import Entity
+from cryptotax.db.models.journal import JournalEntry, JournalSplit
+from cryptotax.db.models.wallet import OnChainWallet
+from cryptotax.db.repos.account_repo import AccountRepo
+
+
+async def _setup(session):
+    entity = Entity(name="Test", base_currency="VND")
+    session.add(entity)
+    await session.flush()
+    wallet = OnChainWallet(entity_id=entity.id, chain="ethereum", address="0xabc")
+    session.add(wallet)
+    await session.flush()
+    eth = NativeAsset(wallet_id=wallet.id, account_type="ASSET", symbol="ETH")
+    usdc = ERC20Token(wallet_id=wallet.id, account_type="ASSET", symbol="USDC")
+    idle = NativeAsset(wallet_id=wallet.id, account_type="ASSET", symbol="BNB")
+    session.add_all([eth, usdc, idle])
+    await session.flush()
+    session.add(JournalEntry(
+        entity_id=entity.id,
+        entry_type="SWAP",
+        timestamp=datetime.now(UTC),
+        splits=[
+            JournalSplit(account_id=eth.id, quantity=Decimal("-1"), value_usd=Decimal("-2000"), value_vnd=Decimal("-50000000")),
+            JournalSplit(account_id=eth.id, quantity=Decimal("3"), value_usd=None, value_vnd=None),
+            JournalSplit(account_id=usdc.id, quantity=Decimal("2000"), value_usd=Decimal("2000"), value_vnd=Decimal("50000000")),
+        ],
+    ))
+    await session.flush()
+    return entity, eth, usdc, idle
+
+
+class TestAccountRepoBalances:
+    async def test_entity_totals_combine_quantity_usd_vnd(self, session):
+        entity, eth, usdc, idle = await _setup(session)
+        repo = AccountRepo(session)
+
+        totals = await repo.get_balance_totals_for_entity(entity.id)
+        assert totals == {
+            eth.id: (Decimal("2"), Decimal("-2000"), Decimal("-50000000")),
+            usdc.id: (Decimal("2000"), Decimal("2000"), Decimal("50000000")),
+        }
+        assert await repo.get_balances_for_entity(entity.id) == {eth.id: Decimal("2"), usdc.id: Decimal("2000")}
+        assert (await repo.get_balances_usd_vnd_for_entity(entity.id))[usdc.id] == (Decimal("2000"), Decimal("50000000"))
+
+    async def test_get_balances_for_account_ids(self, session):
+        _, eth, usdc, idle = await _setup(session)
+        repo = AccountRepo(session)
+
+        assert await repo.get_balances([eth.id, idle.id]) == {
+            eth.id: (Decimal("2"), Decimal("-2000"), Decimal("-50000000")),
+        }
+        assert await repo.get_balances([]) == {}
+
+
+class TestAccountRepoListing:
+    async def test_stream_matches_list(self, session):
+        entity, eth, usdc, idle = await _setup(session)
+        repo = AccountRepo(session)
+
+        listed = await repo.get_all_for_entity(entity.id, symbol="ETH")
+        streamed = [a async for a in repo.stream_all_for_entity(entity.id, symbol="ETH")]
+        assert [a.id for a in streamed] == [a.id for a in listed] == [eth.id]
+        assert len([a async for a in repo.stream_all_for_entity(entity.id)]) == 3
+
+
+class TestAccountRepoLookups:
+    async def test_get_by_id_label_and_balance(self, session):
+        _, eth, usdc, idle = await _setup(session)
+        eth.label = "ethereum:0xabc:native_asset"
+        await session.flush()
+        repo = AccountRepo(session)
+
+        assert await repo.get_by_id(usdc.id) is usdc
+        assert await repo.get_by_label("ethereum:0xabc:native_asset") is eth
+        assert await repo.get_by_label("missing") is None
+        assert await repo.get_balance(eth.id) == Decimal("2")
+        assert await repo.get_balance(idle.id) == 0
@@ -0,0 +1,145 @@
+from datetime import UTC, datetime
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from cryptotax.db.models.account import Account, ERC20Token, NativeAsset
+from cryptotax.db.models.entity import Entity
+from cryptotax.db.models.journal import JournalEntry, JournalSplit
+from cryptotax.db.models.wallet import OnChainWallet
+from cryptotax.db.repos.analytics_repo import AnalyticsRepo
+from cryptotax.db.session import Base
+
+
+@pytest.fixture()
+async def factory(tmp_path):
+    # Concurrent queries each open their own connection, so use a file DB rather than :memory:
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'analytics.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    yield async_sessionmaker(engine, expire_on_commit=False)
+    await engine.dispose()
+
+
+async def _seed(session) -> Entity:
+    entity = Entity(name="Test", base_currency="VND")
+    session.add(entity)
+    await session.flush()
+    wallet = OnChainWallet(entity_id=entity.id, chain="ethereum", address="0xabc")
+    session.add(wallet)
+    await session.flush()
+    eth = NativeAsset(wallet_id=wallet.id, account_type="ASSET", symbol="ETH")
+    usdc = ERC20Token(wallet_id=wallet.id, account_type="ASSET", symbol="USDC", protocol="uniswap")
+    session.add_all([eth, usdc])
+    await session.flush()
+    session.add(JournalEntry(
+        entity_id=entity.id,
+        entry_type="SWAP",
+        timestamp=datetime.now(UTC),
+        splits=[
+            JournalSplit(account_id=eth.id, quantity=Decimal("-1"), value_usd=Decimal("-2000"), value_vnd=Decimal("-50000000")),
+            JournalSplit(account_id=usdc.id, quantity=Decimal("2000"), value_usd=Decimal("2000"), value_vnd=Decimal("50000000")),
+        ],
+    ))
+    await session.commit()
+    return entity
+
+
+class TestKPISummary:
+    async def test_concurrent_matches_sequential(self, factory):
+        async with factory() as session:
+            entity = await _seed(session)
+            sequential = await AnalyticsRepo(session).get_kpi_summary(entity_id=entity.id)
+            concurrent = await AnalyticsRepo(session, session_factory=factory).get_kpi_summary(entity_id=entity.id)
+
+        assert concurrent == sequential
+        assert sequential["total_inflow_usd"] == Decimal("2000")
+        assert sequential["total_outflow_usd"] == Decimal("-2000")
+        assert sequential["net_usd"] == 0
+        assert sequential["total_entries"] == 1
+        assert sequential["unique_tokens"] == 2
+        assert sequential["unique_protocols"] == 1
+
+    async def test_counts_respect_filters(self, factory):
+        async with factory() as session:
+            entity = await _seed(session)
+            kpi = await AnalyticsRepo(session).get_kpi_summary(entity_id=entity.id, symbol="USDC")
+
+        assert kpi["total_entries"] == 1
+        assert kpi["unique_tokens"] == 1
+        assert kpi["unique_protocols"] == 1
+        assert kpi["total_inflow_usd"] == Decimal("2000")
+        assert kpi["total_outflow_usd"] == 0
+
+
+class TestRunEach:
+    async def test_concurrent_matches_sequential(self, factory):
+        calls = (
+            lambda repo: repo.get_composition_snapshot(entity_id=entity.id),
+            lambda repo: repo.get_top_symbols_by_volume(entity_id=entity.id),
+        )
+        async with factory() as session:
+            entity = await _seed(session)
+            sequential = await AnalyticsRepo(session)._run_each(*calls)
+            concurrent = await AnalyticsRepo(session, session_factory=factory)._run_each(*calls)
+
+        assert concurrent == sequential
+        assert [len(rows) for rows in sequential] == [2, 2]
+
+
+class TestCompositionSnapshot:
+    async def test_streams_nonzero_balances(self, factory):
+        async with factory() as session:
+            entity = await _seed(session)
+            rows = await AnalyticsRepo(session).get_composition_snapshot(entity_id=entity.id)
+
+        assert [(r["symbol"], r["total_quantity"]) for r in rows] == [("USDC", Decimal("2000")), ("ETH", Decimal("-1"))]
+        assert rows[0]["total_value_usd"] == Decimal("2000")
+
+
+class TestTopSymbols:
+    async def test_entry_filters_still_apply_without_default_join(self, factory):
+        async with factory() as session:
+            entity = await _seed(session)
+            repo = AnalyticsRepo(session)
+            unfiltered = await repo.get_top_symbols_by_volume(entity_id=entity.id)
+            swaps = await repo.get_top_symbols_by_volume(entity_id=entity.id, entry_type="SWAP")
+            transfers = await repo.get_top_symbols_by_volume(entity_id=entity.id, entry_type="TRANSFER")
+
+        assert [r["symbol"] for r in unfiltered] == ["ETH", "USDC"]
+        assert all(r["entry_count"] == 1 for r in unfiltered)
+        assert swaps == unfiltered
+        assert transfers == []
+
+
+class TestEntryCounts:
+    async def test_entries_with_several_splits_count_once(self, factory):
+        async with factory() as session:
+            entity = await _seed(session)
+            eth = (await session.execute(select(Account).where(Account.symbol == "ETH"))).scalar_one()
+            # Two ETH legs in one entry (e.g. a fee and a transfer out of the same account)
+            session.add(JournalEntry(
+                entity_id=entity.id,
+                entry_type="TRANSFER",
+                timestamp=datetime.now(UTC),
+                splits=[
+                    JournalSplit(account_id=eth.id, quantity=Decimal("-0.5"), value_usd=Decimal("-1000"), value_vnd=Decimal("-25000000")),
+                    JournalSplit(account_id=eth.id, quantity=Decimal("-0.25"), value_usd=Decimal("-500"), value_vnd=Decimal("-12500000")),
+                ],
+            ))
+            await session.commit()
+
+            repo = AnalyticsRepo(session)
+            symbols = {r["symbol"]: r for r in await repo.get_top_symbols_by_volume(entity_id=entity.id)}
+            entry_types = {r["entry_type"]: r for r in await repo.get_entry_type_breakdown(entity_id=entity.id)}
+
+        assert symbols["ETH"]["entry_count"] == 2
+        assert symbols["ETH"]["volume_usd"] == Decimal("3500")
+        assert symbols["ETH"]["outflow_usd"] == Decimal("-3500")
+        assert symbols["ETH"]["total_quantity"] == Decimal("1.75")
+        assert symbols["USDC"]["entry_count"] == 1
+        assert entry_types["TRANSFER"]["entry_count"] == 1
+        assert entry_types["TRANSFER"]["volume_usd"] == Decimal("1500")
+        assert entry_types["SWAP"]["entry_count"] == 1
@@ -0,0 +1,16 @@
+"""Tests for Settings loading."""
+
+from cryptotax.config import get_settings, settings
+from cryptotax.container import Container
+
+
+def test_settings_loaded_once_and_shared_with_container():
+    assert get_settings() is settings
+    assert Container().settings() is settings
+
+
+def test_database_url_built_from_db_fields():
+    assert settings.database_url == (
+        f"postgresql+asyncpg://{settings.db_user}:{settings.db_password}"
+        f"@{settings.db_host}:{settings.db_port}/{settings.db_name}"
+    )
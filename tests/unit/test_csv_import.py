@@ -10,6 +10,9 @@ from cryptotax.api.main import app
 from cryptotax.db.models.csv_import import CsvImport, CsvImportRow
 from cryptotax.db.repos.csv_import_repo import CsvImportRepo
 from cryptotax.db.session import Base
+from cryptotax.infra.cache.namespaces import ANALYTICS_CACHE_NAMESPACE, STATS_CACHE_NAMESPACE
+from cryptotax.infra.cache.response_cache import ResponseCache
+from tests.unit.infra.test_response_cache import FakeRedis
 import cryptotax.db.models  # noqa: F401
 
 
@@ -99,6 +102,21 @@ class TestUploadEndpoint:
         assert res.status_code == 400
         assert "missing required columns" in res.json()["detail"].lower()
 
+    async def test_upload_missing_single_column_names_it(self, client):
+        entity_id = await _create_entity(client)
+        no_coin_csv = (
+            '"User_ID","UTC_Time","Account","Operation","Change","Remark"\n'
+            '"123456","2024-01-15 10:30:00","Spot","Transaction Buy","0.001",""\n'
+        )
+
+        res = await client.post(
+            "/api/imports/upload",
+            data={"entity_id": entity_id, "exchange": "binance"},
+            files={"file": ("no_coin.csv", io.BytesIO(no_coin_csv.encode()), "text/csv")},
+        )
+        assert res.status_code == 400
+        assert res.json()["detail"] == "CSV missing required columns: Coin"
+
     async def test_upload_empty_csv_returns_400(self, client):
         entity_id = await _create_entity(client)
         empty_csv = '"User_ID","UTC_Time","Account","Operation","Coin","Change","Remark"\n'
@@ -188,6 +206,47 @@ class TestDetailEndpoint:
         assert res.status_code == 404
 
 
+class TestParseEndpoint:
+    """Tests for POST /api/imports/{import_id}/parse."""
+
+    async def test_parse_invalidates_cached_analytics(self, client, monkeypatch):
+        cache = ResponseCache(FakeRedis())
+        monkeypatch.setattr(app.state, "response_cache", cache, raising=False)
+        entity_id = await _create_entity(client)
+        upload_res = await client.post(
+            "/api/imports/upload",
+            data={"entity_id": entity_id, "exchange": "binance"},
+            files={"file": ("parse.csv", io.BytesIO(VALID_CSV.encode()), "text/csv")},
+        )
+        import_id = upload_res.json()["import_id"]
+
+        url = f"/api/analytics/entry-types?entity_id={entity_id}"
+        assert (await client.get(url)).json() == []
+        assert await cache.get(ANALYTICS_CACHE_NAMESPACE, url) == b"[]"
+
+        res = await client.post(f"/api/imports/{import_id}/parse")
+        assert res.status_code == 200
+        assert res.json()["parsed"] > 0
+        assert await cache.get(ANALYTICS_CACHE_NAMESPACE, url) is None
+        assert (await client.get(url)).json() != []
+
+    async def test_parse_invalidates_cached_parse_stats(self, client, monkeypatch):
+        cache = ResponseCache(FakeRedis())
+        monkeypatch.setattr(app.state, "response_cache", cache, raising=False)
+        entity_id = await _create_entity(client)
+        upload_res = await client.post(
+            "/api/imports/upload",
+            data={"entity_id": entity_id, "exchange": "binance"},
+            files={"file": ("stats.csv", io.BytesIO(VALID_CSV.encode()), "text/csv")},
+        )
+
+        assert (await client.get(f"/api/parse/stats?entity_id={entity_id}")).status_code == 200
+        assert await cache.get(STATS_CACHE_NAMESPACE, entity_id) is not None
+
+        await client.post(f"/api/imports/{upload_res.json()['import_id']}/parse")
+        assert await cache.get(STATS_CACHE_NAMESPACE, entity_id) is None
+
+
 class TestCsvImportRepo:
     """Tests for CsvImportRepo methods."""
 
@@ -0,0 +1,65 @@
+from datetime import UTC, datetime
+from decimal import Decimal
+
+from cryptotax.db.models.account import NativeAsset
+from cryptotax.db.models.entity import Entity
+from cryptotax.db.models.journal import JournalEntry, JournalSplit
+from cryptotax.db.models.wallet import OnChainWallet
+from cryptotax.db.repos.journal_repo import JournalRepo
+
+
+async def _setup(session):
+    entity = Entity(name="Test", base_currency="VND")
+    session.add(entity)
+    await session.flush()
+    wallet = OnChainWallet(entity_id=entity.id, chain="ethereum", address="0xabc")
+    session.add(wallet)
+    await session.flush()
+    account = NativeAsset(wallet_id=wallet.id, account_type="ASSET", symbol="ETH")
+    session.add(account)
+    await session.flush()
+    return entity, account
+
+
+def _entry(entity, account, *usd_values: str | None) -> JournalEntry:
+    return JournalEntry(
+        entity_id=entity.id,
+        entry_type="SWAP",
+        timestamp=datetime.now(UTC),
+        splits=[
+            JournalSplit(
+                account_id=account.id,
+                quantity=Decimal(1),
+                value_usd=Decimal(v) if v is not None else None,
+                value_vnd=Decimal(v) * 25000 if v is not None else None,
+            )
+            for v in usd_values
+        ],
+    )
+
+
+class TestJournalRepoBalance:
+    async def test_validate_balanced_bulk_returns_only_unbalanced(self, session):
+        entity, account = await _setup(session)
+        balanced = _entry(entity, account, "-100", "100")
+        unbalanced = _entry(entity, account, "-100", "90")
+        unpriced = _entry(entity, account, None, None)
+        session.add_all([balanced, unbalanced, unpriced])
+        await session.flush()
+
+        repo = JournalRepo(session)
+        assert await repo.validate_balanced_bulk([balanced.id, unbalanced.id, unpriced.id]) == {unbalanced.id}
+        assert await repo.validate_balanced_bulk([]) == set()
+
+    async def test_list_unbalanced_scoped_to_entity(self, session):
+        entity, account = await _setup(session)
+        other = Entity(name="Other", base_currency="VND")
+        session.add(other)
+        await session.flush()
+        mine = _entry(entity, account, "5")
+        theirs = _entry(other, account, "5")
+        session.add_all([mine, theirs, _entry(entity, account, "1", "-1")])
+        await session.flush()
+
+        entries = await JournalRepo(session).list_unbalanced(entity.id)
+        assert [e.id for e in entries] == [mine.id]
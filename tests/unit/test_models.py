@@ -51,6 +51,26 @@ class TestWalletSTI:
         assert wallet.sync_status == "IDLE"
         assert wallet.last_block_loaded is None
 
+    async def test_wallet_entity_is_never_lazy_loaded(self, session):
+        from sqlalchemy import select
+        from sqlalchemy.exc import InvalidRequestError
+        from sqlalchemy.orm import selectinload
+
+        entity = Entity(name="Dana", base_currency="VND")
+        session.add(entity)
+        await session.flush()
+        session.add(OnChainWallet(entity_id=entity.id, chain=Chain.ETHEREUM, address="0xabc"))
+        await session.commit()
+        session.expunge_all()
+
+        wallet = (await session.execute(select(OnChainWallet))).scalar_one()
+        with pytest.raises(InvalidRequestError):
+            wallet.entity
+        session.expunge_all()
+
+        wallet = (await session.execute(select(OnChainWallet).options(selectinload(OnChainWallet.entity)))).scalar_one()
+        assert wallet.entity.name == "Dana"
+
 
 class TestAccountSTI:
     async def test_native_asset_subtype(self, session):
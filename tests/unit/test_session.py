@@ -0,0 +1,27 @@
+"""Tests for engine construction and pool warm-up."""
+
+from cryptotax.db.session import build_engine, warm_pool
+
+
+async def test_build_engine_applies_pool_settings(tmp_path):
+    engine = build_engine(
+        f"sqlite+aiosqlite:///{tmp_path / 'pool.db'}",
+        pool_size=3,
+        max_overflow=2,
+        pool_timeout=5.0,
+        pool_recycle=600,
+        query_cache_size=50,
+    )
+    assert engine.sync_engine._compiled_cache.capacity == 50
+    pool = engine.sync_engine.pool
+    assert pool.size() == 3
+    assert pool._max_overflow == 2
+    assert pool._recycle == 600
+    await engine.dispose()
+
+
+async def test_warm_pool_opens_connections(tmp_path):
+    engine = build_engine(f"sqlite+aiosqlite:///{tmp_path / 'warm.db'}", pool_size=3)
+    await warm_pool(engine, 3)
+    assert engine.sync_engine.pool.checkedin() == 3
+    await engine.dispose()
@@ -76,6 +76,20 @@ class TestTransactionRepo:
         found = await repo.get_by_hash("0xnonexistent")
         assert found is None
 
+    async def test_get_by_hash_with_wallet(self, session):
+        wallet = await _create_wallet(session)
+        repo = TransactionRepo(session)
+        await repo.bulk_insert([_make_tx(wallet.id, "0xjoined")])
+
+        found = await repo.get_by_hash_with_wallet("0xjoined")
+        assert found is not None
+        tx, tx_wallet = found
+        assert tx.tx_hash == "0xjoined"
+        assert isinstance(tx_wallet, OnChainWallet)
+        assert tx_wallet.id == wallet.id
+
+        assert await repo.get_by_hash_with_wallet("0xnonexistent") is None
+
     async def test_list_for_wallet_pagination(self, session):
         wallet = await _create_wallet(session)
         repo = TransactionRepo(session)
@@ -87,8 +101,13 @@ class TestTransactionRepo:
         assert total == 10
         assert len(page1) == 3
 
-        page2, _ = await repo.list_for_wallet(wallet.id, limit=3, offset=3)
+        page2, total2 = await repo.list_for_wallet(wallet.id, limit=3, offset=3)
         assert len(page2) == 3
+        assert total2 == 10
+
+        past_end, total_past_end = await repo.list_for_wallet(wallet.id, limit=3, offset=20)
+        assert past_end == []
+        assert total_past_end == 10
 
         # No overlap
         hashes1 = {tx.tx_hash for tx in page1}